@@ -0,0 +1,62 @@
+from pfs import *
+from pathlib import Path
+from io import BytesIO
+from tempfile import TemporaryDirectory
+import os
+import random
+import tester
+import time
+
+def buildFS(numFiles: int, fileSize: int) -> PortableFS:
+    # Files of words picked at random compress about as well as ordinary text does
+    rand: random.Random = random.Random(0)
+    words: list[bytes] = [bytes(rand.choices(b"abcdefghijklmnopqrstuvwxyz", k=rand.randint(2, 10))) for _ in range(2000)]
+    pfs: PortableFS = PortableFS(BytesIO(b"pfs0" + bytes([1, 0]) + b"compBench".ljust(13, b"\x00") + bytes([1, 0]) + bytes(5)))
+    for i in range(numFiles):
+        pth = pfs.Path(f"A:/file{i}.txt")
+        pth.touch()
+        with pth.open("wb") as file:
+            file.write(b" ".join(rand.choices(words, k=fileSize // 6))[:fileSize])
+
+    return pfs
+
+def throughput(pfs: PortableFS, total: int, level: int, threads: int, blockSize: int | None = None) -> tuple[float, float]:
+    with TemporaryDirectory() as tmp:
+        path: Path = Path(tmp, "compBench.pfs")
+        start: float = time.perf_counter()
+        pfs.save(path, compression=level, blockSize=blockSize, threads=threads)
+        taken: float = time.perf_counter() - start
+        ratio: float = total / path.stat().st_size
+        path.unlink()
+
+    return total / taken / 0x100000, ratio
+
+def table(pfs: PortableFS, total: int, levels: list[int], workers: list[int], blockSize: int | None = None) -> dict[tuple[int, int], float]:
+    results: dict[tuple[int, int], float] = {}
+    print(f"{'level':>5} {'threads':>7} {'MiB/s':>8} {'ratio':>6}")
+    for level in levels:
+        for threads in workers:
+            results[(level, threads)], ratio = throughput(pfs, total, level, threads, blockSize)
+            print(f"{level:>5} {threads:>7} {results[(level, threads)]:>8.1f} {ratio:>6.2f}")
+
+    return results
+
+def speedup() -> float:
+    # Half of ideal scaling over up to four cores, with one core only being held to not slowing down much
+    return max(0.5, min(os.cpu_count() or 1, 4) * 0.5)
+
+if __name__ == "__main__":
+    tester.GLOBALS |= {"build": buildFS, "table": table, "speedup": speedup}
+
+    tester.describe("PortableFS Compression Throughput", r'''
+    it("single frame saves across levels and threads", """
+        pfs = build(32, 0x40000)
+        results = table(pfs, 32 * 0x40000, [1, 3, 9, 19], [0, 2, 4, -1])
+        passed(all([results[(level, -1)] > results[(level, 0)] * speedup() for level in [1, 3, 9, 19]]))
+    """)
+    it("block saves across levels and threads", """
+        pfs = build(32, 0x40000)
+        results = table(pfs, 32 * 0x40000, [1, 3, 9, 19], [0, 2, 4, -1], blockSize=0x20000)
+        passed(all([results[(level, -1)] > results[(level, 0)] * speedup() for level in [1, 3, 9, 19]]))
+    """)
+    ''')
@@ -0,0 +1,85 @@
+from pfs import *
+from pathlib import Path
+from typing import BinaryIO
+from tempfile import TemporaryDirectory
+import tester
+import time
+
+def buildArchive(path: Path, numDirs: int, numFiles: int) -> None:
+    with path.open("wb") as file:
+        file.write(b"pfs0" + bytes([0]) + b"parseBench".ljust(13, b"\x00") + bytes([1, 0]))
+        file.write(numDirs.to_bytes(2, byteorder="big"))
+        for i in range(numDirs):
+            name: bytes = f"dir{i}".encode()
+            file.write((i + 16).to_bytes(2, byteorder="big") + bytes([len(name)]) + name + bytes([0]) + (0 if i == 0 else (i - 1) // 10 + 16).to_bytes(2, byteorder="big"))
+
+        file.write(numFiles.to_bytes(3, byteorder="big"))
+        entries: list[bytes] = []
+        for i in range(numFiles):
+            name = f"file{i}.bin".encode()
+            entries.append(bytes([len(name)]) + name + bytes([0]) + (i % numDirs + 16).to_bytes(2, byteorder="big") + bytes(16))
+
+        file.write(b"".join(entries))
+
+def parsePerField(file: BinaryIO) -> tuple[list[Drive], list[Directory], list[File]]:
+    # How the tables were read before, with a read or two for every field
+    file.read(4)
+    file.read(1)
+    file.read(13)
+    numDrives: int = readBits(file, 4, 1)
+    drives: list[Drive] = []
+    for _ in range(numDrives):
+        driveName = PortableFS._DRIVE_CHARS[readBits(file, 4, 0)]
+        file.seek(-1, 1)
+        drives.append(Drive(driveName, readBits(file, 4, 1)))
+
+    dirs: list[Directory] = []
+    for _ in range(int.from_bytes(file.read(2), byteorder="big")):
+        dirID = int.from_bytes(file.read(2), byteorder="big")
+        dirname = file.read(int(file.read(1).hex(), 16)).decode("utf-8")
+        attributesInt = readBits(file, 2, 0)
+        highDir = int.from_bytes(file.read(2), byteorder="big")
+        dirs.append(Directory(dirID, dirname, DirAttrs(bool(attributesInt >> 1)), highDir))
+
+    files: list[File] = []
+    for _ in range(int.from_bytes(file.read(3), byteorder="big")):
+        filename = file.read(int(file.read(1).hex(), 16)).decode("utf-8")
+        attributesInt = readBits(file, 2, 0)
+        highDir = int.from_bytes(file.read(2), byteorder="big")
+        offset = int.from_bytes(file.read(8), byteorder="big")
+        size = int.from_bytes(file.read(8), byteorder="big")
+        files.append(File(filename, FileAttrs(bool(attributesInt >> 1), bool(attributesInt & 1)), highDir, offset, size))
+
+    return drives, dirs, files
+
+def compare(numDirs: int, numFiles: int) -> tuple[float, float, bool]:
+    with TemporaryDirectory() as tmp:
+        path: Path = Path(tmp, "parseBench.pfs")
+        buildArchive(path, numDirs, numFiles)
+        start: float = time.perf_counter()
+        with path.open("rb") as file:
+            drives, dirs, files = parsePerField(file)
+
+        perField: float = time.perf_counter() - start
+        pfs: PortableFS = PortableFS(path, lazy=True)
+        # The tables are read again on their own, so the time doesn't include building the tree
+        pfs.file.seek(0)
+        start = time.perf_counter()
+        pfs._readHeader()
+        batched: float = time.perf_counter() - start
+        same: bool = (drives, dirs, files) == (pfs.drives, pfs.dirs, pfs.files)
+        pfs.close()
+        path.unlink()
+
+    print(f"{numDirs} dirs, {numFiles} files: per field {perField:.2f} s, batched {batched:.2f} s")
+    return perField, batched, same
+
+if __name__ == "__main__":
+    tester.GLOBALS |= {"compare": compare}
+
+    tester.describe("PortableFS Header Parsing", r'''
+    it("batched parsing of a 1M entry archive beats reading field by field", """
+        perField, batched, same = compare(1000, 1000000)
+        passed(same and batched < perField)
+    """)
+    ''')
@@ -0,0 +1,55 @@
+from pfs import *
+from pathlib import Path
+from io import BytesIO
+from tempfile import TemporaryDirectory
+import tester
+import tracemalloc
+
+def buildArchive(path: Path, numFiles: int, fileSize: int, **saveArgs) -> int:
+    pfs: PortableFS = PortableFS(BytesIO(b"pfs0" + bytes([1, 0]) + b"memTest".ljust(13, b"\x00") + bytes([1, 0]) + bytes(5)))
+    for i in range(numFiles):
+        pth = pfs.Path(f"A:/file{i}.bin")
+        pth.touch()
+        with pth.open("wb") as file:
+            file.write(bytes([i % 256]) * fileSize)
+
+    pfs.save(path, **saveArgs)
+    pfs.close()
+    return numFiles * fileSize
+
+def peakOpenMemory(path: Path, **openArgs) -> int:
+    tracemalloc.start()
+    pfs: PortableFS = PortableFS(path, **openArgs)
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    pfs.close()
+    return peak
+
+def measure(numFiles: int, fileSize: int, saveArgs: dict | None = None, **openArgs) -> tuple[int, int]:
+    with TemporaryDirectory() as tmp:
+        path: Path = Path(tmp, "memTst.pfs")
+        dataLen: int = buildArchive(path, numFiles, fileSize, **(saveArgs or {}))
+        used: int = peakOpenMemory(path, **openArgs)
+        path.unlink()
+
+    print(f"data section: {dataLen} bytes, peak while loading: {used} bytes")
+    return dataLen, used
+
+if __name__ == "__main__":
+    tester.GLOBALS |= {"measure": measure}
+
+    # Loading should hold the data section once, every file is a view of it rather than a copy
+    tester.describe("PortableFS Loading Memory", r'''
+    it("uncompressed archive is loaded with one copy of its data", """
+        dataLen, used = measure(64, 0x40000)
+        passed(dataLen <= used < dataLen * 1.25)
+    """)
+    it("compressed archive is loaded with one copy of its data", """
+        dataLen, used = measure(64, 0x40000, {"compression": 3})
+        passed(dataLen <= used < dataLen * 1.25)
+    """)
+    it("lazily loaded archive doesn't read its data", """
+        dataLen, used = measure(64, 0x40000, lazy=True)
+        passed(used < dataLen * 0.1)
+    """)
+    ''')
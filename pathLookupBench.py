@@ -0,0 +1,74 @@
+from pfs import *
+from io import BytesIO
+import tester
+import time
+
+def buildTrees(depth: int, numFiles: int) -> tuple[PortableFS, dict, list[str]]:
+    # The same chain of directories both as an archive and as the nested dicts paths used to be looked up in
+    pfs: PortableFS = PortableFS(BytesIO(b"pfs0" + bytes([1, 0]) + b"pathBench".ljust(13, b"\x00") + bytes([1, 0]) + bytes(5)))
+    struct: dict = {"A": {}}
+    contents: dict = struct["A"]
+    path: str = "A:"
+    for i in range(depth - 1):
+        path += f"/dir{i}"
+        pfs.Path(path).mkdir()
+        contents[f"dir{i}"] = (Directory(16 + i, f"dir{i}", DirAttrs(False), 15 + i), {})
+        contents = contents[f"dir{i}"][1]
+
+    paths: list[str] = []
+    for i in range(numFiles):
+        pfs.Path(f"{path}/file{i}.txt").touch()
+        contents[f"file{i}.txt"] = (File(f"file{i}.txt", FileAttrs(False, False), 15 + depth, 0, 0), b"")
+        paths.append(f"{path}/file{i}.txt")
+
+    return pfs, struct, paths
+
+def evalExists(struct: dict, path: str) -> bool:
+    # How FSPath.exists looked paths up before, by building the lookup as source code and evaluating it
+    checkStr: str = "struct"
+    parts: list[str] = [part for part in path.split("/") if part != ""]
+    for i, part in enumerate(parts):
+        if i == 0:
+            checkStr += f"['{part.removesuffix(':')}']"
+
+        elif i < len(parts) - 1:
+            checkStr += f"['{part}'][1]"
+
+        else:
+            checkStr += f"['{part}'][0]"
+
+    try:
+        eval(checkStr, {"__builtins__": None, "struct": struct})
+        return True
+
+    except KeyError:
+        return False
+
+def perLookup(lookup, paths: list[str], rounds: int) -> float:
+    start: float = time.perf_counter()
+    for _ in range(rounds):
+        for path in paths:
+            assert lookup(path)
+
+    return (time.perf_counter() - start) / (rounds * len(paths)) * 1e6
+
+def compare(depth: int, numFiles: int, rounds: int) -> tuple[float, float, float]:
+    pfs, struct, paths = buildTrees(depth, numFiles)
+    before: float = perLookup(lambda path: evalExists(struct, path), paths, rounds)
+    cacheSize: int = PortableFS.pathCacheSize
+    PortableFS.pathCacheSize = 0
+    uncached: float = perLookup(lambda path: pfs.Path(path).exists(), paths, rounds)
+    PortableFS.pathCacheSize = cacheSize
+    cached: float = perLookup(lambda path: pfs.Path(path).exists(), paths, rounds)
+    print(f"depth {depth} lookups: eval {before:.2f} us, node tree {uncached:.2f} us, node tree with the path cache {cached:.2f} us")
+    return before, uncached, cached
+
+if __name__ == "__main__":
+    tester.GLOBALS |= {"compare": compare}
+
+    tester.describe("PortableFS Path Lookup", r'''
+    it("depth 10 lookups are faster through the node tree than through eval", """
+        before, uncached, cached = compare(10, 1000, 20)
+        passed(uncached < before and cached < before)
+    """)
+    ''')
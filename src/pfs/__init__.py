@@ -10,15 +10,23 @@ def VerData(sep: str = " - ") -> str:
     return "\n".join([f"Python Interface Version: {Version(sep)}", f"Spec Versions: {", ".join([str(version) for version in PortableFS._VERSIONS])}"])
 
 from pathlib import Path
-from typing import BinaryIO, Any, Literal
-from copy import deepcopy
+from typing import BinaryIO, Callable, Literal, Iterator
 from rich.traceback import install ; install()
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from weakref import WeakSet
 import re as rgx
-from math import ceil
 from tqdm import tqdm
-from io import BytesIO
+from io import BytesIO, RawIOBase, BufferedIOBase, TextIOWrapper, UnsupportedOperation
+import os
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, Future
+import threading
 import zstandard as zstd
+import mmap
+from struct import Struct, error as StructError
+from tempfile import TemporaryFile, mkstemp
+from shutil import copyfileobj, copymode
+from fnmatch import fnmatchcase
 
 def readBits(stream: BinaryIO, numBits: int, mode: int = 0) -> int:
     numBytes = (numBits + 7) // 8
@@ -71,6 +79,88 @@ class Directory:
     attributes: DirAttrs
     highDir: int
 
+@dataclass
+class ArchiveData:
+    offset: int
+    size: int
+
+@dataclass
+class SpilledData:
+    file: BinaryIO
+    size: int
+
+@dataclass
+class PathCacheInfo:
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+@dataclass
+class PathStat:
+    kind: Literal['file', 'dir', 'drive']
+    size: int
+    attributes: FileAttrs | DirAttrs | None
+    offset: int | None
+    id: int | None
+
+@dataclass
+class DiskUsage:
+    size: int
+    files: int
+    dirs: int
+
+@dataclass(eq=False)
+class FileNode:
+    file: File
+    data: bytes | bytearray | memoryview | ArchiveData | SpilledData
+    parent: "DirNode | None" = field(default=None, repr=False)
+
+@dataclass(eq=False)
+class DirNode:
+    directory: Directory | Drive
+    children: dict[str, "FileNode | DirNode"]
+    parent: "DirNode | None" = field(default=None, repr=False)
+    totalSize: int = field(default=0, repr=False)
+    totalFiles: int = field(default=0, repr=False)
+    totalDirs: int = field(default=0, repr=False)
+
+class MemoryViewIO(RawIOBase):
+    def __init__(self, view: memoryview) -> None:
+        self.__view: memoryview = view.cast("B")
+        self.__pos: int = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        chunk: memoryview = self.__view[self.__pos:self.__pos + len(buffer)]
+        buffer[:len(chunk)] = chunk
+        self.__pos += len(chunk)
+        return len(chunk)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        match whence:
+            case 0:
+                self.__pos = offset
+
+            case 1:
+                self.__pos += offset
+
+            case 2:
+                self.__pos = len(self.__view) + offset
+
+        return self.__pos
+
+    def tell(self) -> int:
+        return self.__pos
+
+    def getbuffer(self) -> memoryview:
+        return self.__view
+
 class PortableFSEncodingError(Exception):
     def __init__(self, message: str) -> None:
         super().__init__(f"PortableFS Encoding Error: {message}")
@@ -88,12 +178,26 @@ class PortableFSFileIOError(Exception):
         super().__init__(f"PortableFS FileIO Error: {message}")
 
 class PortableFS:
-    _VERSIONS: list[int] = [1,2]
+    _VERSIONS: list[int] = [1,2,3,4]
     _DRIVE_CHARS: list[str] = list("ABCDEFGHIJKLMNOP")
+    _DIRS_COUNT: Struct = Struct(">H")
+    _DIR_HEAD: Struct = Struct(">HB")
+    _DIR_TAIL: Struct = Struct(">BH")
+    _FILE_TAIL: Struct = Struct(">BHQQ")
+    _V3_FIELDS: Struct = Struct(">QI")
+    _BLOCK_ENTRY: Struct = Struct(">QI")
     autoSave: bool = False
     chunkSize: int = 80000
-
-    def __init__(self, fspath: Path | BytesIO) -> None:
+    headerChunkSize: int = 0x10000
+    pathCacheSize: int = 4096
+    fileMemoryBudget: int = 0x10000000
+    memoryBudget: int = 0x40000000
+    # -1 uses every core, 0 compresses on the calling thread
+    compressionThreads: int = 0
+    dictionarySize: int = 0x1C000
+    headerReserve: int = 0x1000
+
+    def __init__(self, fspath: Path | BytesIO | memoryview, lazy: bool = False, memoryMap: bool = False) -> None:
         if isinstance(fspath, Path):
             self.fspath: Path = fspath
             self.file: BinaryIO = fspath.open("r+b")
@@ -102,552 +206,753 @@ class PortableFS:
             self.fspath = None # type: ignore
             self.file: BinaryIO = fspath
 
+        elif isinstance(fspath, memoryview):
+            self.fspath = None # type: ignore
+            self.file: BinaryIO = MemoryViewIO(fspath) # type: ignore
+
         self.newfs: bool = False
+        self.dirty: bool = False
+        self._bufferedBytes: int = 0
+        self._openBuffers: set[int] = set()
+        self._openFiles: WeakSet = WeakSet()
         self.__closed: bool = False
-        if self.file.read(4) != b"pfs0":
-            raise ValueError("Not a PortableFS file")
-
-        self.version: int = self.file.read(1)[0]
-
-        if not self.version + 1 in self._VERSIONS:
-            raise ValueError(f"Unsupported PortableFS version: Versions {", ".join([str(version) for version in PortableFS._VERSIONS])} only")
-
-        self.compression: bool = False
-        self.compressionLevel: int = 0
-        if self.version == 1:
-            self.compression = readBits(self.file, 1) == 1
-            self.file.seek(-1, 1)
-            self.compressionLevel = readBits(self.file, 7, 1)
-
-        self.name: str = self.file.read(13).decode("utf-8").rstrip("\x00")
-        self.numDrives: int = readBits(self.file, 4, 1)
-        self.drives: list[Drive] = []
-        for _ in range(self.numDrives):
-            drive_name = self._DRIVE_CHARS[readBits(self.file, 4, 0)]
-            self.file.seek(-1, 1)
-            drive_id = readBits(self.file, 4, 1)
-            self.drives.append(Drive(drive_name, drive_id))
-
-        self.numDirs: int = int.from_bytes(self.file.read(2), byteorder="big")
-        self.dirs: list[Directory] = []
-        for _ in range(self.numDirs):
-            dir_id = int.from_bytes(self.file.read(2), byteorder="big")
-            if dir_id <= 0x0F:
-                raise PortableFSEncodingError("Directory ID must be greater than 0x0F")
-
-            if dir_id >= 0x8000:
-                raise PortableFSEncodingError("Directory ID must be less than 0x8000")
-            dirname = self.file.read(int(self.file.read(1).hex(), 16)).decode("utf-8")
-            attributesInt = readBits(self.file, 2, 0)
-            attrs = (attributesInt >> 1, attributesInt & 1)
-            hightDir = int.from_bytes(self.file.read(2), byteorder="big")
-            self.dirs.append(Directory(dir_id, dirname, DirAttrs(bool(attrs[0])), hightDir))
-
-
-        self.numFiles: int = int.from_bytes(self.file.read(3), byteorder="big")
-        self.files: list[File] = []
-        for _ in range(self.numFiles):
-            filename = self.file.read(int(self.file.read(1).hex(), 16)).decode("utf-8")
-            attributesInt = readBits(self.file, 2, 0)
-            attributes = (attributesInt >> 1, attributesInt & 1)
-            highDir = int.from_bytes(self.file.read(2), byteorder="big")
-            offset = int.from_bytes(self.file.read(8), byteorder="big")
-            size = int.from_bytes(self.file.read(8), byteorder="big")
-            self.files.append(File(filename, FileAttrs(*[bool(attr) for attr in attributes]), highDir, offset, size))
-
-        self.__dataStart: int = self.file.tell()
+        self._generation: int = 0
+        self.__pathCache: OrderedDict[tuple[str, ...], FileNode | DirNode | None] = OrderedDict()
+        self.__cacheGeneration: int = 0
+        self.__cacheHits: int = 0
+        self.__cacheMisses: int = 0
+        self.__nameIndex: dict[str, list[FileNode | DirNode]] = {}
+        self.__suffixIndex: dict[str, set[FileNode | DirNode]] = {}
+        self._readHeader()
+        self.__decompressor: zstd.ZstdDecompressor = self.__newDecompressor()
+        self.__cachedBlock: tuple[int, bytes] | None = None
+        self.file.seek(self.__dataStart)
 
         if isinstance(self.fspath, Path):
             self.__dataLen: int = self.fspath.stat().st_size - self.__dataStart
 
-        elif self.fspath is None:
+        else:
             self.__dataLen: int = len(self.file.getbuffer()) - self.__dataStart # type: ignore
 
-        fileData: bytes = self.file.read(self.__dataLen)
-        if self.compression and len(fileData) > 0:
-            decompressor: zstd.ZstdDecompressor = zstd.ZstdDecompressor()
-            fileData: bytes = decompressor.decompress(self.file.read(self.__dataLen))
+        streaming: bool = self.compression and self.blockSize == 0 and self.__dataLen > 0
+        self.memoryMap: bool = memoryMap or isinstance(fspath, memoryview)
+        self.lazy: bool = lazy or self.memoryMap
+        self.__map: mmap.mmap | None = None
+        self.__view: memoryview | None = None
+        if streaming and self.lazy:
+            self.__spillData()
 
-        class DictStructPath(dict):
-            def traversalSet(self, path: str, value: Any, *, mode: int = 0) -> None:
-                parts: list[str] = [part for part in path.split("/") if part != ""]
-                strCode: str = f"self[{int(parts[0]) if mode == 1 else repr(parts[0])}]"
-                for part in parts[1:-1]:
-                    strCode += f"['{part}'][1]"
+        if self.memoryMap:
+            self.__mapData()
 
-                strCode += f"['{parts[-1]}'] = val"
-                exec(strCode, {"__builtins__": None, "self": self, "val": value})
+        fileData: bytes | bytearray = b""
+        if streaming and not self.lazy:
+            fileData = self.__streamData(max([file.offset + file.size for file in self.files] + [0]))
 
-            def traversalGet(self, path: str, *, mode: int = 0) -> dict | tuple[File, bytes] | tuple[Directory, bytes]:
-                parts: list[str] = [part for part in path.split("/") if part != ""]
-                strCode: str = f"self[{int(parts[0]) if mode == 1 else repr(parts[0])}]"
-                for part in parts[1:-1]:
-                    strCode += f"['{part}'][1]"
+        elif not self.lazy:
+            fileData = self.file.read(self.__dataLen)
 
-                if len(parts) > 1:
-                    strCode += f"['{parts[-1]}']"
+        if self.compression and self.blockSize > 0 and len(fileData) > 0:
+            compressedView: memoryview = memoryview(fileData)
+            # A short block can sit before appended ones, so every block is padded out to the block size
+            fileData = b"".join([self.__decompressBlock(compressedView[frameOffset:frameOffset + frameLen]).ljust(self.blockSize, b"\x00") for frameOffset, frameLen in self.__blocks])
+            del compressedView
 
-                return eval(strCode, {"__builtins__": None, "self": self})
+        dataView: memoryview = memoryview(fileData)
 
-            def traversalGetType(self, type: type) -> list:
-                def getTypesRec(path: str) -> list:
-                    results: list = []
-                    struct = self.traversalGet(path)
-                    if isinstance(struct, tuple):
-                        d = struct[1]
+        def fileContent(file: File) -> memoryview | ArchiveData:
+            if self.lazy:
+                return ArchiveData(file.offset, file.size)
 
-                    else:
-                        d = struct
+            return dataView[file.offset:file.offset + file.size]
 
-                    if not isinstance(d, dict):
-                        raise ValueError("Bad Path")
+        struct: dict[str, DirNode] = {}
+        dirNodes: dict[int, DirNode] = {}
 
-                    for val in d.values():
-                        if isinstance(val[0], type):
-                            results.append(val[0])
+        for drive in self.drives:
+            struct[drive.name] = DirNode(drive, {})
+            dirNodes[drive.id] = struct[drive.name]
 
-                        if isinstance(val[0], Directory):
-                            results.extend(getTypesRec("/".join([path, val[0].name])))
+        for directory in self.dirs:
+            if directory.id in dirNodes:
+                raise PortableFSEncodingError(f"Directory ID {hex(directory.id)} is used more than once")
 
-                    return results
+            dirNodes[directory.id] = DirNode(directory, {})
 
-                results: list = []
-                for name, item in self.items():
-                    idk = getTypesRec(name)
-                    results.extend(idk)
+        for directory in self.dirs:
+            if not directory.highDir in dirNodes:
+                raise PortableFSEncodingError(f"Directory '{directory.name}' ({hex(directory.id)}) is orphaned, its high directory {hex(directory.highDir)} does not exist")
 
-                return results
+            if directory.name in dirNodes[directory.highDir].children:
+                raise PortableFSEncodingError(f"Directory '{directory.name}' ({hex(directory.id)}) has the same name as another item in its high directory {hex(directory.highDir)}")
 
-        self.__strCls = DictStructPath
-        def sortModeHighDir(obj: File | Directory):
-            return obj.highDir
+            dirNodes[directory.highDir].children[directory.name] = dirNodes[directory.id]
+            dirNodes[directory.id].parent = dirNodes[directory.highDir]
+            self._indexNode(dirNodes[directory.id])
 
-        self.files.sort(key=sortModeHighDir)
-        self.dirs.sort(key=sortModeHighDir)
+        for file in self.files:
+            if not file.highDir in dirNodes:
+                raise PortableFSEncodingError(f"File '{file.name}' is orphaned, its high directory {hex(file.highDir)} does not exist")
 
-        struct: DictStructPath = DictStructPath({})
-        HighDirTable: dict[int, list[File | Directory]] = {}
-        dirPathTable: dict[int, str] = {}
+            fileParent: DirNode = dirNodes[file.highDir]
+            if file.name in fileParent.children:
+                raise PortableFSEncodingError(f"File '{file.name}' has the same name as another item in its high directory {hex(file.highDir)}")
 
-        for drive in self.drives:
-            struct[drive.id] = {}
+            fileParent.children[file.name] = FileNode(file, fileContent(file), fileParent)
+            fileParent.totalSize += file.size
+            fileParent.totalFiles += 1
+            self._indexNode(fileParent.children[file.name])
 
-        for file in self.files:
-            if file.highDir <= 0x0F:
-                struct[file.highDir][file.name] = (file, fileData[file.offset:file.offset + file.size])
-                continue
+        highDirs: dict[int, int] = {directory.id: directory.highDir for directory in self.dirs}
+        grounded: set[int] = {drive.id for drive in self.drives}
+        topDown: list[int] = []
+        for directory in self.dirs:
+            chain: list[int] = []
+            inChain: set[int] = set()
+            current: int = directory.id
+            while not current in grounded:
+                if current in inChain:
+                    raise PortableFSEncodingError(f"Directories {", ".join([hex(dirID) for dirID in chain[chain.index(current):]])} form a cycle and can't be reached from any drive")
+
+                chain.append(current)
+                inChain.add(current)
+                current = highDirs[current]
+
+            grounded.update(chain)
+            topDown.extend(reversed(chain))
+
+        for dirID in reversed(topDown):
+            dirNode: DirNode = dirNodes[dirID]
+            dirNode.parent.totalSize += dirNode.totalSize # type: ignore
+            dirNode.parent.totalFiles += dirNode.totalFiles # type: ignore
+            dirNode.parent.totalDirs += dirNode.totalDirs + 1 # type: ignore
+
+        self._struct = struct
+        self.__nextDirID: int = max([directory.id for directory in self.dirs] + [15]) + 1
+        self.__freeDirIDs: list[int] = sorted(set(range(16, self.__nextDirID)) - set(dirNodes), reverse=True)
+        if not self.lazy:
+            self.file.close()
+
+        class FSFileIO(BufferedIOBase):
+            defaultLineSequence: Literal['CR', 'CRLF']
+            ENCODINGS: list[str | None] = [None, 'ascii', 'utf-8', 'utf-16']
 
-            if not file.highDir in HighDirTable.keys():
-                HighDirTable[file.highDir] = [file]
+            @staticmethod
+            def is_mode(mode: str) -> bool:
+                modeRgx = rgx.compile(r'^[rwb+ta]*$')
+                return bool(modeRgx.match(mode))
 
-            else:
-                HighDirTable[file.highDir].append(file)
+            def __init__(fself, node: FileNode, mode: str = "rb") -> None: # pyright: ignore[reportSelfClsParameterName]
+                super().__init__()
+                fself.__pos: int = 0
+                fself.__mode: str = mode
+                fself.__node: FileNode = node
+                fself.__data: bytes | bytearray | memoryview | ArchiveData | SpilledData = b""
+                fself.__shared: bool = True
+                # After a flush the start of the buffer is shared with the node, so rewriting it makes a copy
+                fself.__committed: int = 0
+                fself.__dirty: bool = False
+                self._openFiles.add(fself)
+                if not FSFileIO.is_mode(mode):
+                    raise PortableFSFileIOError("Invalid Mode")
 
+                if not isinstance(node, FileNode):
+                    raise PortableFSFileIOError("Invalid path")
 
-        for directory in self.dirs:
-            if directory.highDir <= 0x0F:
-                struct[directory.highDir][directory.name] = (directory, {})
-                dirPathTable[directory.id] = f"{directory.highDir}/{directory.name}"
-                if directory.id in HighDirTable.keys():
-                    for item in HighDirTable[directory.id]:
-                        if isinstance(item, File):
-                            struct.traversalSet(f"{dirPathTable[directory.id]}/{item.name}", (item, fileData[item.offset:item.offset + item.size]), mode=1)
-                            continue
+                fself.__data = self._nodeData(node)
+                if "w" in mode:
+                    fself.__own(bytearray())
+                    fself.__dirty = True
 
-                        if isinstance(item, Directory):
-                            struct.traversalSet(f"{dirPathTable[directory.id]}/{item.name}", (item, {}), mode=1)
-                            continue
+            def __load(fself, *, own: bool = False) -> None: # pyright: ignore[reportSelfClsParameterName]
+                if isinstance(fself.__data, SpilledData):
+                    if own and fself.__shared:
+                        fself.__copy()
 
-                    HighDirTable.pop(directory.id)
+                    return
 
-                continue
+                if own and (fself.__shared or not isinstance(fself.__data, bytearray)) and fself.__size() > PortableFS.fileMemoryBudget:
+                    fself.__spill()
+                    return
 
-            if directory.highDir in dirPathTable.keys():
-                struct.traversalSet(f"{dirPathTable[directory.highDir]}/{directory.name}", (directory, {}), mode=1)
-                dirPathTable[directory.id] = f"{dirPathTable[directory.highDir]}/{directory.name}"
-                if directory.id in HighDirTable.keys():
-                    for item in HighDirTable[directory.id]:
-                        if isinstance(item, File):
-                            struct.traversalSet(f"{dirPathTable[directory.id]}/{item.name}", (item, fileData[item.offset:item.offset + item.size]), mode=1)
-                            continue
+                if isinstance(fself.__data, ArchiveData):
+                    fself.__data = self._loadData(fself.__data)
+
+                if own and (fself.__shared or not isinstance(fself.__data, bytearray)):
+                    fself.__own(bytearray(fself.__data))
+
+            def __spill(fself) -> None: # pyright: ignore[reportSelfClsParameterName]
+                spill: SpilledData = SpilledData(TemporaryFile(), fself.__size())
+                if isinstance(fself.__data, ArchiveData):
+                    for start in range(0, fself.__data.size, PortableFS.chunkSize):
+                        spill.file.write(self._loadData(fself.__data, start, min(PortableFS.chunkSize, fself.__data.size - start)))
+
+                else:
+                    spill.file.write(fself.__data) # pyright: ignore[reportArgumentType]
+
+                fself.__release()
+                fself.__data = spill
+                fself.__shared = False
+                fself.__committed = 0
+
+            def __copy(fself) -> None: # pyright: ignore[reportSelfClsParameterName]
+                if isinstance(fself.__data, SpilledData):
+                    spill: SpilledData = SpilledData(TemporaryFile(), fself.__data.size)
+                    self._copyData(fself.__data, 0, fself.__data.size, spill.file) # pyright: ignore[reportArgumentType]
+                    fself.__release()
+                    fself.__data = spill
+                    fself.__shared = False
+                    fself.__committed = 0
+
+                else:
+                    fself.__own(bytearray(fself.__data)) # pyright: ignore[reportArgumentType]
+
+            def __own(fself, buffer: bytearray) -> None: # pyright: ignore[reportSelfClsParameterName]
+                fself.__release()
+                fself.__data = buffer
+                fself.__shared = False
+                fself.__committed = 0
+                self._openBuffers.add(id(buffer))
+                self._bufferedBytes += len(buffer)
+
+            def __release(fself) -> None: # pyright: ignore[reportSelfClsParameterName]
+                if isinstance(fself.__data, bytearray) and id(fself.__data) in self._openBuffers:
+                    self._openBuffers.discard(id(fself.__data))
+                    if fself.__node.data is not fself.__data or fself.__node.parent is None:
+                        self._bufferedBytes -= len(fself.__data)
+
+            def __writeBuffer(fself, content: bytes | bytearray | memoryview) -> None: # pyright: ignore[reportSelfClsParameterName]
+                buffer: bytearray = fself.__data # pyright: ignore[reportAssignmentType]
+                if fself.__pos > len(buffer):
+                    buffer.extend(bytes(fself.__pos - len(buffer)))
+
+                buffer[fself.__pos:fself.__pos + len(content)] = content
+
+            def __size(fself) -> int: # pyright: ignore[reportSelfClsParameterName]
+                return fself.__data.size if isinstance(fself.__data, (ArchiveData, SpilledData)) else len(fself.__data)
+
+            def __check_closed(fself) -> None: # pyright: ignore[reportSelfClsParameterName]
+                if fself.closed:
+                    raise ValueError("File I/O operation was done on a closed file")
 
-                        if isinstance(item, Directory):
-                            struct.traversalSet(f"{dirPathTable[directory.id]}/{item.name}", (item, {}), mode=1)
-                            continue
+            def __check_readable(fself) -> None: # pyright: ignore[reportSelfClsParameterName]
+                if not fself.readable():
+                    raise PortableFSFileIOError("Cannot read a file when not in read mode")
 
-                    HighDirTable.pop(directory.id)
+            def getbuffer(fself) -> memoryview: # pyright: ignore[reportSelfClsParameterName]
+                fself.__check_closed()
+                fself.__load()
+                return memoryview(self._loadData(fself.__data))
 
-                continue
+            def truncate(fself, size: int | None = None) -> int: # pyright: ignore[reportSelfClsParameterName]
+                fself.__check_closed()
+                if not fself.writable():
+                    raise PortableFSFileIOError("Cannot truncate a file when not in write mode")
 
-            if not directory.highDir in HighDirTable.keys():
-                HighDirTable[directory.highDir] = [directory]
+                size = fself.__pos if size is None else size
+                if size < 0:
+                    raise ValueError(f"negative size value {size}")
 
-            else:
-                HighDirTable[directory.highDir].append(directory)
+                fself.__load(own=True)
+                if size < fself.__committed:
+                    fself.__copy()
 
-        lastLen: int = 0
-        lenCount: int = 0
-        while len(HighDirTable) > 0:
-            if len(HighDirTable) != lastLen:
-                lastLen = len(HighDirTable)
-                lenCount = 0
+                if isinstance(fself.__data, SpilledData):
+                    if size < fself.__data.size:
+                        fself.__data.file.truncate(size)
+                        fself.__data.size = size
 
-            else:
-                lenCount += 1
+                else:
+                    self._bufferedBytes -= max(0, fself.__size() - size)
+                    try:
+                        del fself.__data[size:] # pyright: ignore[reportIndexIssue]
 
-            if lenCount > 50:
-                print("\n" + str(list(HighDirTable.keys())))
-                print(list(set([[dir for dir in self.dirs if item.highDir == dir.id][0].highDir for waiting in HighDirTable.values() for item in waiting])))
-                raise PortableFSEncodingError("PassingCantPlace")
+                    except BufferError:
+                        fself.__copy()
+                        del fself.__data[size:] # pyright: ignore[reportIndexIssue]
 
-            popQueue: list[int] = []
-            for dirID, items in HighDirTable.items():
-                if isinstance(items, str):
-                    continue
+                fself.__dirty = True
+                return size
 
-                if dirID in dirPathTable.keys():
-                    for item in items:
-                        if isinstance(item, File):
-                            struct.traversalSet(f"{dirPathTable[dirID]}/{item.name}", (item, fileData[item.offset:item.offset + item.size]), mode=1)
-                            continue
+            def flush(fself) -> None: # pyright: ignore[reportSelfClsParameterName]
+                fself.__check_closed()
+                if not fself.__dirty:
+                    return
 
-                        if isinstance(item, Directory):
-                            struct.traversalSet(f"{dirPathTable[dirID]}/{item.name}", (item, {}), mode=1)
-                            continue
+                if isinstance(fself.__data, SpilledData):
+                    fself.__data.file.flush()
 
-                    popQueue.append(dirID)
+                self._dropNodeData(fself.__node)
+                fself.__node.data = SpilledData(fself.__data.file, fself.__data.size) if isinstance(fself.__data, SpilledData) else fself.__data
+                fself.__committed = fself.__size()
+                fself.__dirty = False
+                self.dirty = True
+                self._adjustUsage(fself.__node.parent, fself.__size() - fself.__node.file.size, 0, 0)
+                fself.__node.file.size = fself.__size()
 
-            for dirID in popQueue:
-                HighDirTable.pop(dirID)
+            def readable(fself) -> bool: # pyright: ignore[reportSelfClsParameterName]
+                fself.__check_closed()
+                return "r" in fself.__mode or "+" in fself.__mode
 
-        for drive in self.drives:
-            struct[drive.name] = struct[drive.id]
-            struct.pop(drive.id)
+            def writable(fself) -> bool: # pyright: ignore[reportSelfClsParameterName]
+                fself.__check_closed()
+                return "w" in fself.__mode or "+" in fself.__mode or "a" in fself.__mode
 
-        self._struct = deepcopy(struct)
-        del struct
-        self.file.close()
-        del HighDirTable
-        del dirPathTable
+            def seekable(fself) -> bool: # pyright: ignore[reportSelfClsParameterName]
+                fself.__check_closed()
+                return True
 
-        class FSFileIO:
-            defaultLineSequence: Literal['CR', 'CRLF']
-            ENCODINGS: list[str | None] = [None, 'ascii', 'utf-8', 'utf-16']
+            def write(fself, data: bytes | bytearray | memoryview) -> int: # pyright: ignore[reportSelfClsParameterName]
+                fself.__check_closed()
+                if not fself.writable():
+                    raise PortableFSFileIOError("Cannot write to a file when not in write mode")
 
-            @staticmethod
-            def is_mode(mode: str) -> bool:
-                modeRgx = rgx.compile(r'^[rwb+ta]*$')
-                return bool(modeRgx.match(mode))
+                if isinstance(data, str):
+                    raise PortableFSFileIOError("Cannot write a string in bytes mode")
 
-            def __init__(fself, pathStr: str, mode: str = "rt", encoding: Literal[None, 'ascii', 'utf-8', 'utf-16'] = 'utf-8') -> None: # pyright: ignore[reportSelfClsParameterName]
-                if not FSFileIO.is_mode(mode):
-                    raise PortableFSFileIOError("Invalid Mode")
+                content: bytes | bytearray | memoryview = data
+                fself.__load(own=True)
+                if "a" in fself.__mode:
+                    fself.__pos = fself.__size()
 
-                if not encoding in FSFileIO.ENCODINGS:
-                    raise PortableFSFileIOError("Invalid Encoding")
+                end: int = fself.__pos + len(content)
+                if isinstance(fself.__data, bytearray) and (end > PortableFS.fileMemoryBudget or self._bufferedBytes + max(0, end - len(fself.__data)) > PortableFS.memoryBudget):
+                    fself.__spill()
 
-                fself.__pos: int = 0
-                fself.__mode: str = mode
-                fself.__path: str = pathStr
-                fself.__data: bytes = self._struct.traversalGet(pathStr)[1]
-                fself.__enc: Literal[None, 'ascii', 'utf-8', 'utf-16'] = encoding
-                fself.__closed: bool = False
-                if not isinstance(fself.__data, bytes):
-                    raise PortableFSFileIOError("Invalid path")
+                if fself.__pos < fself.__committed:
+                    fself.__copy()
 
-            def truncate(self) -> None:
-                self.__data = bytes()
+                if isinstance(fself.__data, SpilledData):
+                    fself.__data.file.seek(fself.__pos)
+                    fself.__data.file.write(content)
+                    fself.__data.size = max(fself.__data.size, end)
 
-            def __check_closed(self) -> None:
-                if self.__closed:
-                    raise ValueError("File I/O operation was done on a closed file")
+                else:
+                    self._bufferedBytes += max(0, end - fself.__size())
+                    try:
+                        fself.__writeBuffer(content)
 
-            def close(self) -> None:
-                self.flush()
-                self.__closed = True
+                    except BufferError:
+                        # A reader still holds a view of the buffer, so it can't be resized
+                        fself.__copy()
+                        fself.__writeBuffer(content)
 
-            def flush(fself) -> None: # pyright: ignore[reportSelfClsParameterName]
-                fself.__check_closed()
-                self._struct.traversalSet(fself.__path, (self._struct.traversalGet(fself.__path)[0], fself.__data))
+                fself.__pos = end
+                fself.__dirty = True
+                return len(data)
 
-            def readable(self) -> bool:
-                self.__check_closed()
-                return "r" in self.__mode or "+" in self.__mode
+            def close(fself) -> None: # pyright: ignore[reportSelfClsParameterName]
+                if fself.closed:
+                    return
 
-            def writable(self) -> bool:
-                self.__check_closed()
-                return "w" in self.__mode or "+" in self.__mode or "a" in self.__mode
+                try:
+                    super().close()
 
-            def write(self, data: str | bytes) -> None:
-                self.__check_closed()
-                if not self.writable():
-                    raise PortableFSFileIOError("Cannot write to a file when not in write mode")
+                finally:
+                    fself.__release()
+                    fself.__data = b""
+                    self._openFiles.discard(fself)
 
-                binMode: bool = 'b' in self.__mode
+            def _releaseArchive(fself) -> None: # pyright: ignore[reportSelfClsParameterName]
+                # Data the new archive won't have is read out of the old one before it's replaced
+                if isinstance(fself.__data, ArchiveData) and (fself.__node.data is not fself.__data or fself.__node.parent is None):
+                    if fself.__size() > PortableFS.fileMemoryBudget:
+                        fself.__spill()
 
-                if binMode and isinstance(data, str):
-                    raise PortableFSFileIOError("Cannot write a string in bytes mode")
+                    else:
+                        fself.__data = bytes(self._loadData(fself.__data))
 
-                if not binMode and isinstance(data, bytes):
-                    raise PortableFSFileIOError("Cannot write bytes in text mode")
+            def _rebindArchive(fself) -> None: # pyright: ignore[reportSelfClsParameterName]
+                if isinstance(fself.__data, ArchiveData):
+                    fself.__data = fself.__node.data
 
-                if binMode:
-                    if "a" in self.__mode:
-                        self.__data += data # pyright: ignore[reportOperatorIssue]
-                        return
+            def readinto(fself, buffer) -> int: # pyright: ignore[reportSelfClsParameterName]
+                fself.__check_closed()
+                fself.__check_readable()
+                with memoryview(buffer) as view, view.cast("B") as target:
+                    num: int = max(0, min(len(target), fself.__size() - fself.__pos))
+                    if num == 0:
+                        return 0
 
-                    self.__data = data # pyright: ignore[reportAttributeAccessIssue]
-                    return
+                    if isinstance(fself.__data, SpilledData):
+                        fself.__data.file.seek(fself.__pos)
+                        fself.__data.file.readinto(target[:num]) # pyright: ignore[reportAttributeAccessIssue]
 
-                if "a" in self.__mode:
-                    self.__data += bytes(data, self.__enc) # pyright: ignore[reportArgumentType]
-                    return
+                    elif isinstance(fself.__data, ArchiveData):
+                        target[:num] = self._loadData(fself.__data, fself.__pos, num)
 
-                self.__data += bytes(data, self.__enc) # pyright: ignore[reportArgumentType]
+                    else:
+                        with memoryview(fself.__data) as dataView:
+                            target[:num] = dataView[fself.__pos:fself.__pos + num]
 
-            def read(self, num: int = -1) -> str | bytes:
-                self.__check_closed()
-                if not self.readable():
-                    raise PortableFSFileIOError("Cannot read a file when not in read mode")
+                fself.__pos += num
+                return num
 
-                if 'b' in self.__mode:
-                    if num > 0:
-                        pos: int = self.__pos
-                        self.__pos += num
-                        return self.__data[pos:min(num, len(self.__data))]
+            def copyto(fself, dst: BinaryIO) -> int: # pyright: ignore[reportSelfClsParameterName]
+                fself.__check_closed()
+                fself.__check_readable()
+                start: int = min(fself.__pos, fself.__size())
+                self._copyData(fself.__data, start, fself.__size() - start, dst)
+                fself.__pos = max(fself.__pos, fself.__size())
+                return fself.__size() - start
 
-                if 'b' in self.__mode:
-                    if num > 0:
-                        pos: int = self.__pos
-                        self.__pos += num
-                        return self.__data[pos:min(num, len(self.__data))]
+            def readinto1(fself, buffer) -> int: # pyright: ignore[reportSelfClsParameterName]
+                return fself.readinto(buffer)
 
-                    return self.__data[self.__pos:]
+            def read(fself, num: int | None = -1) -> bytes: # pyright: ignore[reportSelfClsParameterName]
+                fself.__check_closed()
+                fself.__check_readable()
+                start: int = min(fself.__pos, fself.__size())
+                end: int = fself.__size() if num is None or num < 0 else min(start + num, fself.__size())
+                if isinstance(fself.__data, (ArchiveData, SpilledData)):
+                    content: bytes = bytes(self._loadData(fself.__data, start, end - start))
 
-                enc: str | None = self.__enc
-                if enc is None:
-                    self.__mode += 'b'
-                    if num > 0:
-                        pos: int = self.__pos
-                        self.__pos += num
-                        return self.__data[pos:min(num, len(self.__data))]
+                else:
+                    content = bytes(fself.__data[start:end])
 
-                    return self.__data[self.__pos:]
+                fself.__pos = max(fself.__pos, end)
+                return content
 
-                if num > 0:
-                    pos: int = self.__pos
-                    self.__pos += num
-                    return self.__data[self.__pos:min(num, len(self.__data))].decode(enc)
+            def read1(fself, num: int | None = -1) -> bytes: # pyright: ignore[reportSelfClsParameterName]
+                return fself.read(num)
 
-                return self.__data[self.__pos:].decode(enc)
+            def readall(fself) -> bytes: # pyright: ignore[reportSelfClsParameterName]
+                return fself.read()
 
-            def tell(self) -> int:
-                self.__check_closed()
-                return self.__pos
+            def tell(fself) -> int: # pyright: ignore[reportSelfClsParameterName]
+                fself.__check_closed()
+                return fself.__pos
 
-            def seek(self, num: int, mode: int = 0) -> None:
-                self.__check_closed()
+            def seek(fself, num: int, mode: int = 0) -> int: # pyright: ignore[reportSelfClsParameterName]
+                fself.__check_closed()
                 match mode:
                     case 0:
-                        self.__pos = num
+                        pos: int = num
 
                     case 1:
-                        self.__pos += num
+                        pos = fself.__pos + num
 
                     case 2:
-                        self.__pos = len(self.__data) - (1 + num)
+                        pos = fself.__size() + num
+
+                    case _:
+                        raise ValueError(f"invalid whence ({mode}, should be 0, 1 or 2)")
+
+                if pos < 0:
+                    raise ValueError(f"negative seek position {pos}")
+
+                fself.__pos = pos
+                return pos
+
+        def openFile(node: FileNode | DirNode | None, mode: str, encoding: Literal[None, 'ascii', 'utf-8', 'utf-16'], newline: Literal['CRLF', 'LF'] = 'LF') -> FSFileIO | TextIOWrapper:
+            if not FSFileIO.is_mode(mode):
+                raise PortableFSFileIOError(f"'{mode}' is not a valid mode.")
+
+            if not encoding in FSFileIO.ENCODINGS:
+                raise PortableFSFileIOError(f"'{encoding}' is not a valid encoding, can be 'ascii', 'utf-8', or 'utf-16'.")
 
-            def __enter__(self):
-                return self
+            if not isinstance(node, FileNode):
+                raise PortableFSFileIOError("Invalid path")
 
-            def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-                self.close()
+            file: FSFileIO = FSFileIO(node, mode)
+            if "b" in mode or encoding is None:
+                return file
+
+            return TextIOWrapper(file, encoding=encoding, newline="\r\n" if newline == "CRLF" else "\n")
+
+        @dataclass(slots=True)
+        class FSDirEntry:
+            name: str
+            path: "FSPath"
+            kind: Literal['file', 'dir']
+            size: int
+            attributes: FileAttrs | DirAttrs
+            offset: int | None
+            id: int | None
+            _node: FileNode | DirNode = field(repr=False)
+
+            def is_file(self) -> bool:
+                return self.kind == 'file'
+
+            def is_dir(self) -> bool:
+                return self.kind == 'dir'
+
+            def open(self, mode: str = 'rt', encoding: Literal['ascii', 'utf-8', 'utf-16'] = 'utf-8') -> FSFileIO | TextIOWrapper:
+                if not isinstance(self._node, FileNode):
+                    raise PortableFSFileIOError("Cannot open a directory")
+
+                return openFile(self._node, mode, encoding)
 
         class FSPath:
-            def __init__(pself, *strPath) -> None: # pyright: ignore[reportSelfClsParameterName]
+            __slots__ = ("_parts", "_path", "_suffixes", "_hash")
+
+            def __init__(pself, *strPath: str) -> None: # pyright: ignore[reportSelfClsParameterName]
+                pself.__setup(tuple([part for segment in strPath for part in segment.split("/") if part != ""]))
+
+            def __setup(pself, parts: tuple[str, ...]) -> None: # pyright: ignore[reportSelfClsParameterName]
                 self._check_closed()
-                pself.path: str = "/".join(strPath)
-                pself.name: str = [part for part in pself.path.split("/") if part != ""][-1]
-                pself.drive: str = pself.path.split("/")[0].removesuffix(":")
-                pself.suffix: str = "." + pself.name.split(".")[-1] if "." in pself.name else ""
-                pself.stem: str = pself.name[: -len(pself.suffix)] if pself.suffix else pself.name
-                pself.suffixes: list[str] = [f".{ext}" for ext in pself.name.split(".")[1:]] if "." in pself.name else []
+                if len(parts) == 0:
+                    raise PortableFSPathError("A path needs at least a drive")
 
-            def __Obj(pself) -> File | Directory | Drive: # pyright: ignore[reportSelfClsParameterName]
-                if pself.is_drive():
-                    for drive in self.drives:
-                        if drive.name == pself.drive:
-                            return drive
+                object.__setattr__(pself, "_parts", parts)
+                object.__setattr__(pself, "_path", None)
+                object.__setattr__(pself, "_suffixes", None)
+                object.__setattr__(pself, "_hash", None)
 
-                    raise PortableFSPathError("Drive does not exist")
+            @staticmethod
+            def _fromParts(parts: tuple[str, ...]) -> "FSPath":
+                newPath: FSPath = object.__new__(FSPath)
+                newPath.__setup(parts)
+                return newPath
 
-                checkStr: str = "struct"
-                parts: list[str] = [part for part in pself.path.split("/") if part != ""]
-                for i, part in enumerate(parts):
-                    if i == 0:
-                        checkStr += f"['{part.removesuffix(':')}']"
+            def __setattr__(pself, name: str, value) -> None: # pyright: ignore[reportSelfClsParameterName]
+                raise AttributeError("FSPath objects are immutable")
 
-                    elif i < len(parts) - 1:
-                        checkStr += f"['{part}'][1]"
+            def __delattr__(pself, name: str) -> None: # pyright: ignore[reportSelfClsParameterName]
+                raise AttributeError("FSPath objects are immutable")
 
-                    else:
-                        checkStr += f"['{part}'][0]"
+            def __hash__(pself) -> int: # pyright: ignore[reportSelfClsParameterName]
+                if pself._hash is None:
+                    object.__setattr__(pself, "_hash", hash(pself._parts))
 
-                try:
-                    result: File | Directory = eval(checkStr, {"__builtins__": None, "struct": self._struct})
-                    return result
+                return pself._hash # pyright: ignore[reportReturnType]
 
-                except KeyError:
-                    raise PortableFSFileNotFoundError(f"path '{pself.path}'")
+            def __eq__(pself, other) -> bool: # pyright: ignore[reportSelfClsParameterName]
+                if not isinstance(other, FSPath):
+                    return NotImplemented
 
-            def __StructData(pself) -> tuple[File | Directory, bytes | dict] | dict: # pyright: ignore[reportSelfClsParameterName]
-                if pself.is_drive():
-                    return self._struct[pself.drive]
+                return pself._parts == other._parts
 
-                checkStr: str = "struct"
-                parts: list[str] = [part for part in pself.path.split("/") if part != ""]
-                for i, part in enumerate(parts):
-                    if i == 0:
-                        checkStr += f"['{part.removesuffix(':')}']"
+            @property
+            def parts(pself) -> tuple[str, ...]: # pyright: ignore[reportSelfClsParameterName]
+                return pself._parts
 
-                    elif i < len(parts) - 1:
-                        checkStr += f"['{part}'][1]"
+            @property
+            def path(pself) -> str: # pyright: ignore[reportSelfClsParameterName]
+                if pself._path is None:
+                    object.__setattr__(pself, "_path", f"{pself._parts[0]}/" if len(pself._parts) == 1 else "/".join(pself._parts))
 
-                    else:
-                        checkStr += f"['{part}']"
+                return pself._path # pyright: ignore[reportReturnType]
 
-                try:
-                    result: tuple[File, bytes] | tuple[Directory, dict] = eval(checkStr, {"__builtins__": None, "struct": self._struct})
-                    return result
+            @property
+            def name(pself) -> str: # pyright: ignore[reportSelfClsParameterName]
+                return pself._parts[-1]
 
-                except KeyError:
-                    raise PortableFSFileNotFoundError(f"path '{pself.path}'")
+            @property
+            def drive(pself) -> str: # pyright: ignore[reportSelfClsParameterName]
+                return pself._parts[0].removesuffix(":")
 
-            def exists(pself) -> bool: # pyright: ignore[reportSelfClsParameterName]
-                if pself.is_drive():
-                    return True
+            @property
+            def suffixes(pself) -> list[str]: # pyright: ignore[reportSelfClsParameterName]
+                if pself._suffixes is None:
+                    object.__setattr__(pself, "_suffixes", tuple([f".{ext}" for ext in pself.name.split(".")[1:]]))
 
-                checkStr: str = "struct"
-                parts: list[str] = [part for part in pself.path.split("/") if part != ""]
-                for i, part in enumerate(parts):
-                    if i == 0:
-                        checkStr += f"['{part.removesuffix(':')}']"
+                return list(pself._suffixes) # pyright: ignore[reportArgumentType]
 
-                    elif i < len(parts) - 1:
-                        checkStr += f"['{part}'][1]"
+            @property
+            def suffix(pself) -> str: # pyright: ignore[reportSelfClsParameterName]
+                return "." + pself.name.rsplit(".", 1)[-1] if "." in pself.name else ""
 
-                    else:
-                        checkStr += f"['{part}'][0]"
+            @property
+            def stem(pself) -> str: # pyright: ignore[reportSelfClsParameterName]
+                suffix: str = pself.suffix
+                return pself.name[: -len(suffix)] if suffix else pself.name
 
-                try:
-                    eval(checkStr, {"__builtins__": None, "struct": self._struct})
-                    return True
+            def __Node(pself) -> FileNode | DirNode: # pyright: ignore[reportSelfClsParameterName]
+                node: FileNode | DirNode | None = self._resolve(pself._parts)
+                if node is None:
+                    if pself.is_drive():
+                        raise PortableFSPathError("Drive does not exist")
+
+                    raise PortableFSFileNotFoundError(f"path '{pself.path}'")
+
+                return node
+
+            def __Obj(pself) -> File | Directory | Drive: # pyright: ignore[reportSelfClsParameterName]
+                node: FileNode | DirNode = pself.__Node()
+                if isinstance(node, FileNode):
+                    return node.file
 
-                except KeyError:
-                    return False
+                return node.directory
+
+            def exists(pself) -> bool: # pyright: ignore[reportSelfClsParameterName]
+                return self._resolve(pself._parts) is not None
 
             def is_drive(pself) -> bool: # pyright: ignore[reportSelfClsParameterName]
-                drivePattern = rgx.compile(r"^[ABCDEFGHIJKLMNOP]:/?$")
-                return bool(drivePattern.match(pself.path))
+                return len(pself._parts) == 1 and len(pself._parts[0]) == 2 and pself._parts[0][1] == ":" and pself._parts[0][0] in PortableFS._DRIVE_CHARS
 
 
             def is_file(pself) -> bool: # pyright: ignore[reportSelfClsParameterName]
-                checkStr: str = "struct"
-                parts: list[str] = [part for part in pself.path.split("/") if part != ""]
-                for i, part in enumerate(parts):
-                    if i == 0:
-                        checkStr += f"['{part.removesuffix(':')}']"
+                return isinstance(self._resolve(pself._parts), FileNode)
 
-                    elif i < len(parts) - 1:
-                        checkStr += f"['{part}'][1]"
+            def is_dir(pself) -> bool: # pyright: ignore[reportSelfClsParameterName]
+                return isinstance(self._resolve(pself._parts), DirNode)
 
-                    else:
-                        checkStr += f"['{part}'][0]"
+            def stat(pself) -> PathStat: # pyright: ignore[reportSelfClsParameterName]
+                node: FileNode | DirNode = pself.__Node()
+                if isinstance(node, FileNode):
+                    return PathStat('file', node.file.size, node.file.attributes, node.file.offset, None)
 
-                try:
-                    result: File | Directory = eval(checkStr, {"__builtins__": None, "struct": self._struct})
-                    if isinstance(result, File):
-                        return True
+                if isinstance(node.directory, Drive):
+                    return PathStat('drive', 0, None, None, node.directory.id)
 
-                    return False
+                return PathStat('dir', 0, node.directory.attributes, None, node.directory.id)
 
-                except KeyError:
-                    return False
+            def du(pself) -> DiskUsage: # pyright: ignore[reportSelfClsParameterName]
+                node: FileNode | DirNode = pself.__Node()
+                if isinstance(node, FileNode):
+                    return DiskUsage(node.file.size, 1, 0)
 
-            def is_dir(pself) -> bool: # pyright: ignore[reportSelfClsParameterName]
-                if pself.is_drive():
-                    return True
+                return DiskUsage(node.totalSize, node.totalFiles, node.totalDirs)
 
-                checkStr: str = "struct"
-                parts: list[str] = [part for part in pself.path.split("/") if part != ""]
-                for i, part in enumerate(parts):
-                    if i == 0:
-                        checkStr += f"['{part.removesuffix(':')}']"
+            def iterdir(pself): # pyright: ignore[reportSelfClsParameterName]
+                node: FileNode | DirNode | None = self._resolve(pself._parts)
+                if not isinstance(node, DirNode):
+                    raise PortableFSPathError("Cannot iterate the contents of a file, or a directory that does not exist.")
 
-                    elif i < len(parts) - 1:
-                        checkStr += f"['{part}'][1]"
+                for filename in list(node.children):
+                    yield pself.joinpath(filename)
+
+            def scandir(pself) -> Iterator[FSDirEntry]: # pyright: ignore[reportSelfClsParameterName]
+                node: FileNode | DirNode | None = self._resolve(pself._parts)
+                if not isinstance(node, DirNode):
+                    raise PortableFSPathError("Cannot scan the contents of a file, or a directory that does not exist.")
+
+                for name, child in list(node.children.items()):
+                    if isinstance(child, FileNode):
+                        yield FSDirEntry(name, FSPath._fromParts(pself._parts + (name,)), 'file', child.file.size, child.file.attributes, child.file.offset, None, child)
 
                     else:
-                        checkStr += f"['{part}'][0]"
+                        yield FSDirEntry(name, FSPath._fromParts(pself._parts + (name,)), 'dir', 0, child.directory.attributes, None, child.directory.id, child) # type: ignore
+
+            def walk(pself, top_down: bool = True, follow_hidden: bool = True) -> Iterator[tuple["FSPath", list[str], list[str]]]: # pyright: ignore[reportSelfClsParameterName]
+                node: FileNode | DirNode | None = self._resolve(pself._parts)
+                if not isinstance(node, DirNode):
+                    raise PortableFSPathError("Cannot walk a file, or a directory that does not exist.")
+
+                toWalk: list = [(pself, node)]
+                while len(toWalk) > 0:
+                    item = toWalk.pop()
+                    if len(item) == 3:
+                        yield item
+                        continue
+
+                    dirpath, dirNode = item
+                    dirnames: list[str] = []
+                    filenames: list[str] = []
+                    subdirs: dict[str, DirNode] = {}
+                    for name, child in dirNode.children.items():
+                        if isinstance(child, FileNode):
+                            if follow_hidden or not child.file.attributes.hidden:
+                                filenames.append(name)
+
+                        elif follow_hidden or not child.directory.attributes.hidden: # type: ignore
+                            dirnames.append(name)
+                            subdirs[name] = child
+
+                    if top_down:
+                        # The caller can prune dirnames in place
+                        yield dirpath, dirnames, filenames
 
-                try:
-                    result: File | Directory = eval(checkStr, {"__builtins__": None, "struct": self._struct})
-                    if isinstance(result, Directory):
-                        return True
+                    else:
+                        toWalk.append((dirpath, dirnames, filenames))
 
-                    return False
+                    for name in reversed(dirnames):
+                        if name in subdirs:
+                            toWalk.append((FSPath._fromParts(dirpath._parts + (name,)), subdirs[name]))
 
-                except KeyError:
-                    return False
+            def glob(pself, pattern: str) -> Iterator["FSPath"]: # pyright: ignore[reportSelfClsParameterName]
+                segments: list[str] = [segment for segment in pattern.split("/") if segment != "" and segment != "."]
+                if len(segments) == 0:
+                    raise ValueError(f"Unacceptable pattern: '{pattern}'")
 
-            def iterdir(pself): # pyright: ignore[reportSelfClsParameterName]
-                if not pself.is_dir():
-                    raise PortableFSPathError("Cannot iterate the contents of a file, or a directory that does not exist.")
+                node: FileNode | DirNode | None = self._resolve(pself._parts)
+                if not isinstance(node, DirNode):
+                    raise PortableFSPathError("Cannot glob inside a file, or a directory that does not exist.")
 
-                checkStr: str = "struct"
-                parts: list[str] = [part for part in pself.path.split("/") if part != ""]
-                for i, part in enumerate(parts):
-                    if i == 0:
-                        checkStr += f"['{part.removesuffix(':')}']"
+                if len(segments) >= 2 and segments[-2] == "**" and not "**" in segments[:-2] and segments[-1] != "**":
+                    bases: set[DirNode] = {match for match, _ in pself.__matchSegments(node, segments[:-2]) if isinstance(match, DirNode)}
+                    for candidate in self._indexCandidates(segments[-1]):
+                        ancestor: DirNode | None = candidate.parent
+                        while ancestor is not None and not ancestor in bases:
+                            ancestor = ancestor.parent
 
-                    else:
-                        checkStr += f"['{part}'][1]"
+                        if ancestor is not None:
+                            yield FSPath._fromParts(self._nodeParts(candidate))
 
-                d: dict = eval(checkStr, {"__builtins__": None, "struct": self._struct})
-                for filename in d:
-                    yield pself.joinpath(filename)
+                    return
+
+                seen: set[FileNode | DirNode] = set()
+                for match, parts in pself.__matchSegments(node, segments):
+                    if not match in seen:
+                        seen.add(match)
+                        yield FSPath._fromParts(parts)
+
+            def rglob(pself, pattern: str) -> Iterator["FSPath"]: # pyright: ignore[reportSelfClsParameterName]
+                return pself.glob(f"**/{pattern}")
+
+            def __matchSegments(pself, node: DirNode, segments: list[str]) -> Iterator[tuple["FileNode | DirNode", tuple[str, ...]]]: # pyright: ignore[reportSelfClsParameterName]
+                toMatch: list[tuple[FileNode | DirNode, tuple[str, ...], int]] = [(node, pself._parts, 0)]
+                while len(toMatch) > 0:
+                    current, parts, idx = toMatch.pop()
+                    if idx == len(segments):
+                        yield current, parts
+                        continue
+
+                    if not isinstance(current, DirNode):
+                        continue
+
+                    segment: str = segments[idx]
+                    if segment == "**":
+                        toMatch.append((current, parts, idx + 1))
+                        toMatch.extend([(child, parts + (name,), idx) for name, child in current.children.items() if isinstance(child, DirNode)])
+
+                    elif not any([char in segment for char in "*?["]):
+                        if segment in current.children:
+                            toMatch.append((current.children[segment], parts + (segment,), idx + 1))
+
+                    else:
+                        toMatch.extend([(child, parts + (name,), idx + 1) for name, child in current.children.items() if fnmatchcase(name, segment)])
 
             @property
-            def parent(pself): # pyright: ignore[reportSelfClsParameterName]
-                dirs: list[str] = [part for part in pself.path.split("/") if part != ""]
-                if len(dirs) == 1:
+            def parent(pself) -> "FSPath": # pyright: ignore[reportSelfClsParameterName]
+                if len(pself._parts) == 1:
                     raise PortableFSPathError("A Drive Root path has no parent")
 
-                path: str = "/".join(dirs[:-1])
-                if not "/" in path:
-                    path += "/"
-
-                return FSPath(path)
+                return FSPath._fromParts(pself._parts[:-1])
 
-            def joinpath(pself, *strPath): # pyright: ignore[reportSelfClsParameterName]
-                return FSPath(pself.path.removesuffix("/"), *strPath)
+            def joinpath(pself, *strPath: str) -> "FSPath": # pyright: ignore[reportSelfClsParameterName]
+                return FSPath._fromParts(pself._parts + tuple([part for segment in strPath for part in segment.split("/") if part != ""]))
 
             def touch(pself) -> None: # pyright: ignore[reportSelfClsParameterName]
-                if not pself.parent.exists():
+                parent: FileNode | DirNode | None = self._resolve(pself.parent._parts)
+                if not isinstance(parent, DirNode):
                     raise PortableFSPathError("Cannot touch a file if its parent does not exist.")
 
-                path = "/".join([pself.drive] + [part for i, part in enumerate(pself.path.split("/")) if i != 0])
+                if pself.name in parent.children:
+                    self._detachTree(parent.children[pself.name])
 
                 # For some reason, python mangles 'self.__dataLen' wrong
-                self._struct.traversalSet(path, (File(pself.name, FileAttrs(False, False), pself.parent.__Obj().id, self._PortableFS__dataLen, 0), b"")) # pyright: ignore[reportAttributeAccessIssue]
+                parent.children[pself.name] = FileNode(File(pself.name, FileAttrs(False, False), parent.directory.id, self._PortableFS__dataLen, 0), b"", parent) # pyright: ignore[reportAttributeAccessIssue]
+                self._indexNode(parent.children[pself.name])
+                self._adjustUsage(parent, 0, 1, 0)
+                self._generation += 1
+                self.dirty = True
 
             def mkdir(pself) -> None: # pyright: ignore[reportSelfClsParameterName]
-                if not pself.parent.exists():
+                parent: FileNode | DirNode | None = self._resolve(pself.parent._parts)
+                if not isinstance(parent, DirNode):
                     raise PortableFSPathError("Cannot make a directory if its parent does not exist.")
 
-                path = "/".join([pself.drive] + [part for i, part in enumerate(pself.path.split("/")) if i != 0])
+                newID: int = self._allocDirID()
+                if pself.name in parent.children:
+                    self._detachTree(parent.children[pself.name])
 
-                self._struct.traversalSet(path, (Directory(max([Dir.id for Dir in self._struct.traversalGetType(Directory)] + [15]) + 1, pself.name, DirAttrs(False), pself.parent.__Obj().id), {})) # pyright: ignore[reportAttributeAccessIssue]
+                parent.children[pself.name] = DirNode(Directory(newID, pself.name, DirAttrs(False), parent.directory.id), {}, parent)
+                self._indexNode(parent.children[pself.name])
+                self._adjustUsage(parent, 0, 0, 1)
+                self._generation += 1
+                self.dirty = True
 
             def unlink(pself) -> None: # pyright: ignore[reportSelfClsParameterName]
                 if pself.is_drive():
@@ -656,18 +961,14 @@ class PortableFS:
                 if not pself.exists():
                     raise PortableFSPathError("Cannot unlink a file or directory that does not exist")
 
-                d: bytes | dict = pself.parent.__StructData()[1]
-                if isinstance(d, dict):
-                    d.pop(pself.name)
-
-            def open(pself, mode: str = 'rt', encoding: Literal['ascii', 'utf-8', 'utf-16'] = 'utf-8', newline: Literal['CRLF', 'LF'] = 'LF') -> FSFileIO: # pyright: ignore[reportSelfClsParameterName]
-                if not FSFileIO.is_mode(mode):
-                    raise PortableFSFileIOError(f"'{mode}' is not a valid mode.")
-
-                if not encoding in FSFileIO.ENCODINGS:
-                    raise PortableFSFileIOError(f"'{encoding}' is not a valid encoding, can be 'ascii', 'utf-8', or 'utf-16'.")
+                parent: FileNode | DirNode = pself.parent.__Node()
+                if isinstance(parent, DirNode):
+                    self._detachTree(parent.children.pop(pself.name))
+                    self._generation += 1
+                    self.dirty = True
 
-                return FSFileIO("/".join([part.removesuffix(":") if i == 0 else part for i, part in enumerate(pself.path.split("/"))]), mode, encoding)
+            def open(pself, mode: str = 'rt', encoding: Literal['ascii', 'utf-8', 'utf-16'] = 'utf-8', newline: Literal['CRLF', 'LF'] = 'LF') -> FSFileIO | TextIOWrapper: # pyright: ignore[reportSelfClsParameterName]
+                return openFile(pself.__Node(), mode, encoding, newline)
 
             def __str__(self) -> str:
                 return self.path
@@ -680,24 +981,453 @@ class PortableFS:
     def __repr__(self) -> str:
         return f"PortableFS< name: '{self.name} path: '{self.fspath} >"
 
+    def _readHeader(self) -> None:
+        header: bytearray = bytearray()
+
+        def fill(end: int) -> None:
+            while len(header) < end:
+                chunk: bytes = self.file.read(max(end - len(header), len(header), PortableFS.headerChunkSize))
+                if len(chunk) == 0:
+                    return
+
+                header.extend(chunk)
+
+        fill(5)
+        if header[0:4] != b"pfs0":
+            raise ValueError("Not a PortableFS file")
+
+        self.version: int = header[4]
+        pos: int = 5
+
+        if not self.version + 1 in self._VERSIONS:
+            raise ValueError(f"Unsupported PortableFS version: Versions {", ".join([str(version) for version in PortableFS._VERSIONS])} only")
+
+        try:
+            fill(pos + 14 + 16 + 12 + 2)
+            self.compression: bool = False
+            self.compressionLevel: int = 0
+            if self.version >= 1:
+                self.compression = header[pos] >> 7 == 1
+                self.compressionLevel = header[pos] & 0x7F
+                pos += 1
+
+            self.name: str = header[pos:pos + 13].decode("utf-8").rstrip("\x00")
+            self.numDrives: int = header[pos + 13] & 0x0F
+            pos += 14
+
+            self.drives: list[Drive] = []
+            for driveByte in header[pos:pos + self.numDrives]:
+                self.drives.append(Drive(self._DRIVE_CHARS[driveByte >> 4], driveByte & 0x0F))
+
+            pos += self.numDrives
+            dataOffset: int | None = None
+            self.blockSize: int = 0
+            if self.version >= 2:
+                dataOffset, self.blockSize = self._V3_FIELDS.unpack_from(header, pos)
+                pos += 12
+
+            self.numDirs: int = self._DIRS_COUNT.unpack_from(header, pos)[0]
+            pos += 2
+            self.dirs: list[Directory] = []
+            for _ in range(self.numDirs):
+                # A directory entry is never longer than 261 bytes
+                if pos + 261 > len(header):
+                    fill(pos + 261)
+
+                dir_id, nameLen = self._DIR_HEAD.unpack_from(header, pos)
+                if dir_id <= 0x0F:
+                    raise PortableFSEncodingError("Directory ID must be greater than 0x0F")
+
+                if dir_id >= 0x8000:
+                    raise PortableFSEncodingError("Directory ID must be less than 0x8000")
+
+                dirname = header[pos + 3:pos + 3 + nameLen].decode("utf-8")
+                attributesInt, hightDir = self._DIR_TAIL.unpack_from(header, pos + 3 + nameLen)
+                pos += nameLen + 6
+                self.dirs.append(Directory(dir_id, dirname, DirAttrs(bool(attributesInt >> 7 & 1)), hightDir))
+
+            fill(pos + 3)
+            self.numFiles: int = int.from_bytes(header[pos:pos + 3], byteorder="big")
+            pos += 3
+            self.files: list[File] = []
+            for _ in range(self.numFiles):
+                # A file entry is never longer than 275 bytes
+                if pos + 275 > len(header):
+                    fill(pos + 275)
+
+                nameLen = header[pos]
+                filename = header[pos + 1:pos + 1 + nameLen].decode("utf-8")
+                attributesInt, highDir, offset, size = self._FILE_TAIL.unpack_from(header, pos + 1 + nameLen)
+                pos += nameLen + 20
+                self.files.append(File(filename, FileAttrs(bool(attributesInt >> 7 & 1), bool(attributesInt >> 6 & 1)), highDir, offset, size))
+
+            self.__blocks: list[tuple[int, int]] = []
+            if self.blockSize > 0:
+                fill(pos + 4)
+                numBlocks: int = int.from_bytes(header[pos:pos + 4], byteorder="big")
+                pos += 4
+                fill(pos + numBlocks * self._BLOCK_ENTRY.size)
+                self.__blocks = list(self._BLOCK_ENTRY.iter_unpack(header[pos:pos + numBlocks * self._BLOCK_ENTRY.size]))
+                pos += numBlocks * self._BLOCK_ENTRY.size
+
+            self.dictionary: bytes | None = None
+            if self.version >= 3:
+                fill(pos + 4)
+                dictLen: int = int.from_bytes(header[pos:pos + 4], byteorder="big")
+                pos += 4
+                fill(pos + dictLen)
+                if pos + dictLen > len(header):
+                    raise PortableFSEncodingError("The archive ends in the middle of its header")
+
+                self.dictionary = bytes(header[pos:pos + dictLen])
+                pos += dictLen
+
+        except (StructError, IndexError):
+            raise PortableFSEncodingError("The archive ends in the middle of its header")
+
+        self.__dataStart: int = pos if dataOffset is None else dataOffset
+
     def close(self) -> None:
         if PortableFS.autoSave and not self.newfs:
             self.save()
 
         self.__closed = True
-        self._struct = self.__strCls({})
+        self.__unlinkTree()
+        self._struct = {}
+        self._generation += 1
+        self.__pathCache.clear()
+        self.__nameIndex.clear()
+        self.__suffixIndex.clear()
+        if self.lazy:
+            self.__unmapData()
+
+        self.file.close()
+
+    def __unlinkTree(self) -> None:
+        for node in self._iterNodes():
+            node.parent = None
 
     def _check_closed(self) -> None:
         if self.__closed:
             raise ValueError("Cannot interact with a closed file")
 
+    def _resolve(self, parts: tuple[str, ...]) -> "FileNode | DirNode | None":
+        if len(parts) == 0:
+            return None
+
+        if self.__cacheGeneration != self._generation:
+            self.__pathCache.clear()
+            self.__cacheGeneration = self._generation
+
+        if parts in self.__pathCache:
+            self.__cacheHits += 1
+            self.__pathCache.move_to_end(parts)
+            return self.__pathCache[parts]
+
+        self.__cacheMisses += 1
+        node: FileNode | DirNode | None = self._struct.get(parts[0].removesuffix(":"))
+        for part in parts[1:]:
+            if not isinstance(node, DirNode):
+                node = None
+                break
+
+            node = node.children.get(part)
+
+        if PortableFS.pathCacheSize > 0:
+            self.__pathCache[parts] = node
+            if len(self.__pathCache) > PortableFS.pathCacheSize:
+                self.__pathCache.popitem(last=False)
+
+        return node
+
+    def pathCacheInfo(self) -> PathCacheInfo:
+        return PathCacheInfo(self.__cacheHits, self.__cacheMisses, PortableFS.pathCacheSize, len(self.__pathCache))
+
+    def addDrive(self, name: str) -> None:
+        self._check_closed()
+        if not name in PortableFS._DRIVE_CHARS:
+            raise ValueError("Drives can only be named A-P")
+
+        if name in self._struct:
+            raise ValueError("Drive names must be unique")
+
+        freeIDs: list[int] = [driveID for driveID in range(16) if not driveID in [drive.id for drive in self.drives]]
+        if len(freeIDs) == 0:
+            raise ValueError("Can only have 16 drives")
+
+        drive: Drive = Drive(name, freeIDs[0])
+        self.drives.append(drive)
+        self.numDrives = len(self.drives)
+        self._struct[name] = DirNode(drive, {})
+        self._generation += 1
+        self.dirty = True
+
+    def removeDrive(self, name: str) -> None:
+        self._check_closed()
+        if not name in self._struct:
+            raise PortableFSPathError("Drive does not exist")
+
+        self.drives = [drive for drive in self.drives if drive.name != name]
+        self.numDrives = len(self.drives)
+        for child in self._struct.pop(name).children.values():
+            self._detachTree(child)
+
+        self._generation += 1
+        self.dirty = True
+
+    def _indexNode(self, node: FileNode | DirNode) -> None:
+        name: str = node.file.name if isinstance(node, FileNode) else node.directory.name
+        named: list[FileNode | DirNode] | None = self.__nameIndex.get(name)
+        if named is None:
+            self.__nameIndex[name] = [node]
+
+        else:
+            named.append(node)
+
+        if "." in name:
+            suffix: str = "." + name.rsplit(".", 1)[-1]
+            suffixed: set[FileNode | DirNode] | None = self.__suffixIndex.get(suffix)
+            if suffixed is None:
+                self.__suffixIndex[suffix] = {node}
+
+            else:
+                suffixed.add(node)
+
+    def _detachTree(self, node: FileNode | DirNode) -> None:
+        if isinstance(node, FileNode):
+            self._adjustUsage(node.parent, -node.file.size, -1, 0)
+
+        else:
+            self._adjustUsage(node.parent, -node.totalSize, -node.totalFiles, -(node.totalDirs + 1))
+
+        toDetach: list[FileNode | DirNode] = [node]
+        while len(toDetach) > 0:
+            current: FileNode | DirNode = toDetach.pop()
+            name: str = current.file.name if isinstance(current, FileNode) else current.directory.name
+            self.__nameIndex[name].remove(current)
+            if len(self.__nameIndex[name]) == 0:
+                self.__nameIndex.pop(name)
+
+            if "." in name:
+                suffix: str = "." + name.rsplit(".", 1)[-1]
+                self.__suffixIndex[suffix].discard(current)
+                if len(self.__suffixIndex[suffix]) == 0:
+                    self.__suffixIndex.pop(suffix)
+
+            if isinstance(current, FileNode):
+                self._dropNodeData(current)
+
+            current.parent = None
+            if isinstance(current, DirNode):
+                self.__freeDirIDs.append(current.directory.id)
+                toDetach.extend(current.children.values())
+
+    def _dropNodeData(self, node: FileNode) -> None:
+        if isinstance(node.data, bytearray) and node.parent is not None and id(node.data) not in self._openBuffers:
+            self._bufferedBytes -= len(node.data)
+
+    def _adjustUsage(self, dirNode: DirNode | None, size: int, files: int, dirs: int) -> None:
+        while dirNode is not None:
+            dirNode.totalSize += size
+            dirNode.totalFiles += files
+            dirNode.totalDirs += dirs
+            dirNode = dirNode.parent
+
+    def _allocDirID(self) -> int:
+        if len(self.__freeDirIDs) > 0:
+            return self.__freeDirIDs.pop()
+
+        if self.__nextDirID >= 0x8000:
+            raise PortableFSEncodingError("Cannot make another directory, every directory ID below 0x8000 is in use")
+
+        self.__nextDirID += 1
+        return self.__nextDirID - 1
+
+    def _indexCandidates(self, pattern: str) -> list["FileNode | DirNode"]:
+        if not any([char in pattern for char in "*?["]):
+            return list(self.__nameIndex.get(pattern, ()))
+
+        tail: str = pattern[1:]
+        if pattern.startswith("*") and "." in tail and not any([char in tail for char in "*?["]):
+            return [node for node in self.__suffixIndex.get("." + tail.rsplit(".", 1)[-1], ()) if fnmatchcase(node.file.name if isinstance(node, FileNode) else node.directory.name, pattern)]
+
+        return [node for name, nodes in self.__nameIndex.items() if fnmatchcase(name, pattern) for node in nodes]
+
+    def _nodeParts(self, node: FileNode | DirNode) -> tuple[str, ...]:
+        parts: list[str] = []
+        current: FileNode | DirNode | None = node
+        while current is not None:
+            if isinstance(current, FileNode):
+                parts.append(current.file.name)
+
+            elif isinstance(current.directory, Drive):
+                parts.append(f"{current.directory.name}:")
+
+            else:
+                parts.append(current.directory.name)
+
+            current = current.parent
+
+        return tuple(reversed(parts))
+
+    def find(self, name: str | None = None, suffix: str | None = None, min_size: int | None = None, hidden: bool | None = None) -> Iterator:
+        self._check_closed()
+        if suffix is not None and not suffix.startswith("."):
+            suffix = f".{suffix}"
+
+        if name is not None:
+            candidates: list[FileNode | DirNode] = list(self.__nameIndex.get(name, ()))
+
+        elif suffix is not None:
+            candidates = list(self.__suffixIndex.get(suffix, ()))
+
+        else:
+            candidates = [node for nodes in self.__nameIndex.values() for node in nodes]
+
+        for node in candidates:
+            nodeName: str = node.file.name if isinstance(node, FileNode) else node.directory.name
+            if suffix is not None and not ("." in nodeName and "." + nodeName.rsplit(".", 1)[-1] == suffix):
+                continue
+
+            if min_size is not None and not (isinstance(node, FileNode) and node.file.size >= min_size):
+                continue
+
+            isHidden: bool = node.file.attributes.hidden if isinstance(node, FileNode) else node.directory.attributes.hidden # type: ignore
+            if hidden is not None and isHidden != hidden:
+                continue
+
+            yield self.Path._fromParts(self._nodeParts(node))
+
+    def _iterNodes(self) -> Iterator["FileNode | DirNode"]:
+        toVisit: list[DirNode] = list(self._struct.values())
+        while len(toVisit) > 0:
+            for node in toVisit.pop().children.values():
+                yield node
+                if isinstance(node, DirNode):
+                    toVisit.append(node)
+
+    def __streamData(self, dataEnd: int) -> bytearray:
+        fileData: bytearray = bytearray(dataEnd)
+        dataView: memoryview = memoryview(fileData)
+        pos: int = 0
+        with self.__decompressor.stream_reader(self.file, read_size=PortableFS.chunkSize, closefd=False) as reader:
+            while pos < dataEnd:
+                numRead: int = reader.readinto(dataView[pos:pos + PortableFS.chunkSize])
+                if numRead == 0:
+                    raise PortableFSEncodingError("The compressed data ends before the last file's data")
+
+                pos += numRead
+
+        dataView.release()
+        return fileData
+
+    def __spillData(self) -> None:
+        spill: BinaryIO = TemporaryFile()
+        with self.__decompressor.stream_reader(self.file, read_size=PortableFS.chunkSize, closefd=False) as reader:
+            copyfileobj(reader, spill, PortableFS.chunkSize)
+
+        spill.flush()
+        self.file.close()
+        self.file = spill
+        self.__dataStart = 0
+        self.__dataLen = spill.tell()
+
+    def __mapData(self) -> None:
+        if isinstance(self.file, (BytesIO, MemoryViewIO)):
+            self.__view = self.file.getbuffer()
+
+        elif self.__dataStart + self.__dataLen > 0:
+            self.__map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.__view = memoryview(self.__map)
+
+    def __unmapData(self) -> None:
+        if self.__view is not None:
+            self.__view.release()
+            self.__view = None
+
+        if self.__map is not None:
+            try:
+                self.__map.close()
+
+            except BufferError:
+                # Views of the mapping are still in use, it's unmapped once they're released
+                pass
+
+            self.__map = None
+
+    def __decompressBlock(self, frame: bytes | memoryview) -> bytes:
+        return self.__decompressor.decompress(frame, max_output_size=self.blockSize)
+
+    def __newDecompressor(self) -> zstd.ZstdDecompressor:
+        return zstd.ZstdDecompressor(dict_data=zstd.ZstdCompressionDict(self.dictionary) if self.dictionary is not None else None)
+
+    def __readBlocks(self, offset: int, size: int) -> bytes:
+        if size == 0:
+            return b""
+
+        parts: list[bytes] = []
+        for blockIdx in range(offset // self.blockSize, (offset + size - 1) // self.blockSize + 1):
+            if blockIdx >= len(self.__blocks):
+                raise PortableFSEncodingError(f"File data at offset {offset} runs past the end of the archive")
+
+            if self.__cachedBlock is None or self.__cachedBlock[0] != blockIdx:
+                frameOffset, frameLen = self.__blocks[blockIdx]
+                if self.__view is not None:
+                    frame: bytes | memoryview = self.__view[self.__dataStart + frameOffset:self.__dataStart + frameOffset + frameLen]
+
+                else:
+                    self.file.seek(self.__dataStart + frameOffset)
+                    frame = self.file.read(frameLen)
+
+                self.__cachedBlock = (blockIdx, self.__decompressBlock(frame))
+
+            blockStart: int = blockIdx * self.blockSize
+            parts.append(self.__cachedBlock[1][max(offset - blockStart, 0):offset + size - blockStart])
+
+        return parts[0] if len(parts) == 1 else b"".join(parts)
+
+    def _nodeData(self, node: FileNode) -> bytes | bytearray | memoryview | ArchiveData | SpilledData:
+        # A writer can keep appending past what it flushed, so the node only sees the flushed part
+        if isinstance(node.data, bytearray):
+            return memoryview(node.data)[:node.file.size]
+
+        return node.data
+
+    def _loadData(self, data: bytes | bytearray | memoryview | ArchiveData | SpilledData, start: int = 0, size: int | None = None) -> bytes | bytearray | memoryview:
+        if isinstance(data, SpilledData):
+            data.file.seek(start)
+            return data.file.read(data.size - start if size is None else size)
+
+        if not isinstance(data, ArchiveData):
+            return data
+
+        self._check_closed()
+        offset: int = data.offset + start
+        size = data.size - start if size is None else size
+        if self.compression and self.blockSize > 0:
+            return self.__readBlocks(offset, size)
+
+        if self.__view is not None:
+            viewStart: int = self.__dataStart + offset
+            if viewStart + size > len(self.__view):
+                raise PortableFSEncodingError(f"File data at offset {data.offset} runs past the end of the archive")
+
+            return self.__view[viewStart:viewStart + size]
+
+        self.file.seek(self.__dataStart + offset)
+        content: bytes = self.file.read(size)
+        if len(content) != size:
+            raise PortableFSEncodingError(f"File data at offset {data.offset} runs past the end of the archive")
+
+        return content
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.close()
 
-    def save(self, path: Path | None = None, retIO: bool = False, compression: bool | int | None = None) -> None | BytesIO:
+    def save(self, path: Path | None = None, retIO: bool = False, compression: bool | int | None = None, blockSize: int | None = None, incremental: bool = False, threads: int | None = None, writeContentSize: bool = True, dictionary: bool | int | None = None) -> None | BytesIO:
         if (path is None and self.fspath is None) and (not retIO):
             raise ValueError("Cannot save a PortableFS with no path specified when it was initialized from a BytesIO")
 
@@ -714,40 +1444,53 @@ class PortableFS:
             else:
                 raise ValueError()
 
-        def indexOffset(data: list[bytes], startItemIdx: int) -> int:
-            result: int = 0
-            for i, item in enumerate(data):
-                if i == startItemIdx:
-                    return result
-
-                result += len(item)
-
-            return result
+        def flattenStruct(dirNode: DirNode) -> tuple[list[File], list[Directory], list[FileNode]]:
+            files, dirs, nodes = [], [], []
+            stack: list[Iterator[tuple[str, FileNode | DirNode]]] = [iter(dirNode.children.items())]
+            while len(stack) > 0:
+                entry: tuple[str, FileNode | DirNode] | None = next(stack[-1], None)
+                if entry is None:
+                    stack.pop()
+                    continue
 
-        def flattenStructRec(dirContents: dict[str, tuple[File, bytes] | tuple[Directory, dict]], *, recursing: bool = False) -> tuple[list[File], list[Directory], list[bytes]]:
-            files, dirs, data = [], [], []
-            for name, val in dirContents.items():
-                if isinstance(val[0], File):
+                name, node = entry
+                if isinstance(node, FileNode):
                     print(f"Saving file '{name}'")
-                    file: File = val[0]
+                    file: File = node.file
                     file.name = name
-                    file.size = len(val[1])
-                    data.append(val[1])
+                    content: bytes | bytearray | memoryview | ArchiveData | SpilledData = self._nodeData(node)
+                    file.size = content.size if isinstance(content, (ArchiveData, SpilledData)) else len(content)
+                    nodes.append(node)
                     files.append(file)
                     continue
 
-                if isinstance(val[0], Directory):
-                    folder: Directory = val[0]
+                if isinstance(node, DirNode):
+                    folder: Directory = node.directory # type: ignore
                     folder.name = name
                     dirs.append(folder)
-                    recFiles, recDirs, recData = flattenStructRec(val[1], recursing=False) # type: ignore
-                    files.extend(recFiles)
-                    dirs.extend(recDirs)
-                    data.extend(recData)
-                    continue
-
-            # Remove the offset setting here
-            return files, dirs, data
+                    stack.append(iter(node.children.items()))
+
+            return files, dirs, nodes
+
+        def rebindStruct() -> None:
+            for node in self._iterNodes():
+                if isinstance(node, FileNode):
+                    self._dropNodeData(node)
+                    node.data = ArchiveData(node.file.offset, node.file.size)
+
+        def trainDictionary(size: int) -> bytes | None:
+            nodes: list[FileNode] = [node for node in self._iterNodes() if isinstance(node, FileNode)]
+            contents: list[bytes | bytearray | memoryview | ArchiveData | SpilledData] = [self._nodeData(node) for node in nodes]
+            sampleSizes: list[int] = [min(content.size if isinstance(content, (ArchiveData, SpilledData)) else len(content), PortableFS.chunkSize) for content in contents]
+            step: int = max(1, -(-sum(sampleSizes) // (size * 100)))
+            samples: list[bytes] = [bytes(self._loadData(content, 0, sampleSize)[:sampleSize]) for content, sampleSize in list(zip(contents, sampleSizes))[::step] if sampleSize > 0]
+            print(f"Training a dictionary from {len(samples)} files")
+            try:
+                return zstd.train_dictionary(size, samples, level=compressionLevel, threads=threads).as_bytes()
+
+            except zstd.ZstdError:
+                print(f"Not enough data to train a dictionary, saving without one")
+                return None
 
         if len(self.name) > 13:
             raise PortableFSEncodingError("Cannot save a pfs for spec v1 with a name of greater that 13 chars.")
@@ -755,23 +1498,84 @@ class PortableFS:
         data: bytearray = bytearray(b"pfs0")
         compressing: bool = compression if isinstance(compression, bool) else True if isinstance(compression, int) else self.compression
         compressionLevel: int = 0 if not compressing else compression if isinstance(compression, int) else 10 if isinstance(compression, bool) else self.compressionLevel
-        data.extend(bytes([self.version if not compressing else 1]) + bytes([(int(compressing) << 7) | compressionLevel]) + fixedBytesLength(self.name.encode(), 13) + bytes([len(self.drives)]))
+        blockSize = self.blockSize if blockSize is None else blockSize
+        threads = PortableFS.compressionThreads if threads is None else threads
+        if blockSize >= 1 << 32:
+            raise PortableFSEncodingError("Cannot save a pfs with a block size of 4 GiB or more")
+
+        dictSize: int = 0 if not compressing or isinstance(dictionary, bool) and not dictionary else PortableFS.dictionarySize if isinstance(dictionary, bool) else dictionary if isinstance(dictionary, int) else 0
+        dictData: bytes | None = trainDictionary(dictSize) if dictSize > 0 else self.dictionary if compressing and dictionary is None else None
+        zstdDict: zstd.ZstdCompressionDict | None = zstd.ZstdCompressionDict(dictData) if dictData is not None else None
+        if zstdDict is not None:
+            zstdDict.precompute_compress(level=compressionLevel)
+
+        def newCompressor(threads: int = 0) -> zstd.ZstdCompressor:
+            return zstd.ZstdCompressor(level=compressionLevel, dict_data=zstdDict, threads=threads, write_content_size=writeContentSize)
+
+        blocking: bool = compressing and blockSize > 0
+        version: int = 3 if dictData is not None else 2 if blocking or incremental or self.version >= 2 else 1 if compressing else self.version
+        samePath: bool = not retIO and self.fspath is not None and (path is None or path.resolve() == self.fspath.resolve())
+        sameFormat: bool = (version, compressing, compressionLevel, blockSize if blocking else 0, dictData) == (self.version, self.compression, self.compressionLevel, self.blockSize, self.dictionary)
+        # Incremental saves leave dead bytes behind that only a full save drops
+        liveLen: int = sum([self._struct[drive.name].totalSize for drive in self.drives])
+        deadData: bool = len(self.__blocks) > -(-liveLen // self.blockSize) if self.compression and self.blockSize > 0 else not self.compression and self.__dataLen > liveLen
+        if not self.dirty and samePath and sameFormat and (incremental or not deadData):
+            print(f"No changes to save")
+            return None
+
+        appending: bool = incremental and samePath and sameFormat and self.lazy and version >= 2 and (blocking or not compressing)
+
+        data.extend(bytes([version]))
+        if version >= 1:
+            data.extend(bytes([(int(compressing) << 7) | compressionLevel]))
+
+        data.extend(fixedBytesLength(self.name.encode(), 13) + bytes([len(self.drives)]))
         files: list[File] = []
         dirs: list[Directory] = []
-        data_list: list[bytes] = []
+        fileNodes: list[FileNode] = []
         for drive in self.drives:
             data.extend(bytes([(PortableFS._DRIVE_CHARS.index(drive.name) << 4) + drive.id]))
             print(f"Saving Files From drive '{drive.name}'")
-            dfiles, ddirs, ddata = flattenStructRec(self._struct[drive.name], recursing=False)
+            dfiles, ddirs, dnodes = flattenStruct(self._struct[drive.name])
             files.extend(dfiles)
             dirs.extend(ddirs)
-            data_list.extend(ddata)
+            fileNodes.extend(dnodes)
+
+        data_list: list[bytes | bytearray | memoryview | ArchiveData | SpilledData] = [self._nodeData(node) for node in fileNodes]
+
+        dataOffsetPos: int = len(data)
+        if version >= 2:
+            data.extend(bytes(8) + (blockSize if blocking else 0).to_bytes(4, byteorder="big"))
 
-        # Set offsets globally
-        for i, file in enumerate(files):
-            file.offset = indexOffset(data_list, i)
+        if appending:
+            appendEnd: int = len(self.__blocks) * blockSize if blocking else self.__dataLen
+            for file, item in zip(files, data_list):
+                if not isinstance(item, ArchiveData):
+                    file.offset = appendEnd
+                    appendEnd += file.size
+
+                else:
+                    file.offset = item.offset
+
+            appendLen: int = appendEnd - (len(self.__blocks) * blockSize if blocking else self.__dataLen)
+            tablesLen: int = 2 + sum([self._DIR_HEAD.size + self._DIR_TAIL.size + len(directory.name.encode()) for directory in dirs]) + 3 + sum([1 + self._FILE_TAIL.size + len(file.name.encode()) for file in files])
+            blocksLen: int = 4 + self._BLOCK_ENTRY.size * (len(self.__blocks) + -(-appendLen // blockSize)) if blocking else 0
+            dictLen: int = 4 + len(dictData) if dictData is not None else 0
+            if len(data) + tablesLen + blocksLen + dictLen > self.__dataStart:
+                print(f"The header has outgrown its space, saving the whole archive")
+                appending = False
+
+            else:
+                data_list = [item for item in data_list if not isinstance(item, ArchiveData)]
 
-        fileData = bytearray().join(data_list)
+        dataLen: int = 0
+        if not appending:
+            for file in files:
+                file.offset = dataLen
+                dataLen += file.size
+
+        else:
+            dataLen = appendLen
 
         if len(dirs).bit_length() > 15:
             PortableFSEncodingError("Cannot save a pfs for spec v1 with the total amount of directories larger than 2^15")
@@ -801,35 +1605,311 @@ class PortableFS:
             data.extend(file.offset.to_bytes(8, byteorder="big"))
             data.extend(file.size.to_bytes(8, byteorder="big"))
 
-        print(f"Compiling data")
-
-        if compressing:
-            compressor = zstd.ZstdCompressor(level=compressionLevel)
-            fileData = compressor.compress(fileData)
-
-        if not len(fileData) > PortableFS.chunkSize:
-            print(f"Saving data")
-            data.extend(fileData)
+        # The block index is filled in once the frames are written
+        blocks: list[tuple[int, int]] = list(self.__blocks) if appending and blocking else []
+        blockIndexPos: int = len(data)
+        if blocking:
+            numBlocks: int = len(blocks) + -(-dataLen // blockSize)
+            data.extend(numBlocks.to_bytes(4, byteorder="big") + bytes(self._BLOCK_ENTRY.size * numBlocks))
+
+        if version >= 3:
+            data.extend(len(dictData).to_bytes(4, byteorder="big") + dictData) # type: ignore
+
+        if appending:
+            self.__appendData(data, dataOffsetPos, blockIndexPos, data_list, dataLen, blockSize if blocking else 0, newCompressor, threads, blocks)
+            rebindStruct()
+            self.dirty = False
+            return None
+
+        if version >= 2:
+            data.extend(bytes(max(PortableFS.headerReserve, len(data) // 8)))
+
+        headerLen: int = len(data)
+        if version >= 2:
+            data[dataOffsetPos:dataOffsetPos + 8] = headerLen.to_bytes(8, byteorder="big")
+
+        def writeArchive(out: BinaryIO) -> None:
+            out.write(data)
+            progress: Iterator = tqdm(data_list, desc="Saving data", disable=dataLen <= PortableFS.chunkSize)
+            if blocking:
+                print(f"Compressing data as blocks")
+                self.__writeBlocks(out, progress, blockSize, newCompressor, threads, blocks, 0)
+                out.seek(blockIndexPos + 4)
+                out.write(b"".join([self._BLOCK_ENTRY.pack(frameOffset, frameLen) for frameOffset, frameLen in blocks]))
+                out.seek(0, 2)
+
+            elif compressing:
+                with newCompressor(threads).stream_writer(out, size=dataLen, closefd=False) as writer:
+                    for item in progress:
+                        for chunk in self.__iterData(item):
+                            writer.write(chunk)
 
-        else:
-            print(f"Saving data as chunks")
-            dataChunks: list[bytes] = [fileData[0 + (i * PortableFS.chunkSize):PortableFS.chunkSize + (i * PortableFS.chunkSize)] for i in range(ceil(len(fileData) / PortableFS.chunkSize))]
-            cachedLen: int = len(dataChunks)
-            print(f"Saving {cachedLen} chunks")
-            for chunk in tqdm(dataChunks, desc="Compiling chunks"):
-                data.extend(chunk)
+            else:
+                for item in progress:
+                    self._copyData(item, 0, item.size if isinstance(item, (ArchiveData, SpilledData)) else len(item), out)
 
         print(f"Compiled Data")
         if retIO:
-            return BytesIO(data)
+            out: BytesIO = BytesIO()
+            writeArchive(out)
+            out.seek(0)
+            return out
 
         else:
             svpath = self.fspath if path is None else path
-            if not svpath.exists():
-                svpath.touch()
+            ownPath: bool = self.fspath is not None and svpath.resolve() == self.fspath.resolve()
+            rebinding: bool = self.lazy and ownPath
+            spilled: bool = self.lazy and self.compression and self.blockSize == 0
+            # Saving through a symlink updates the file it points at
+            target: Path = svpath.resolve()
+            tmpFd, tmpName = mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
+            tmpPath: Path = Path(tmpName)
+            try:
+                with open(tmpFd, "wb") as file:
+                    writeArchive(file)
+                    archiveLen: int = file.tell()
+                    file.flush()
+                    os.fsync(file.fileno())
+
+                if target.exists():
+                    copymode(target, tmpPath)
+
+                else:
+                    # mkstemp creates files as 0600
+                    umask: int = os.umask(0)
+                    os.umask(umask)
+                    os.chmod(tmpPath, 0o666 & ~umask)
+
+                if rebinding:
+                    for fileIO in list(self._openFiles):
+                        fileIO._releaseArchive()
+
+                if ownPath:
+                    # Windows can't replace a file that's still open
+                    self.__unmapData()
+                    if not spilled:
+                        self.file.close()
+
+                os.replace(tmpPath, target)
+
+            except BaseException:
+                tmpPath.unlink(missing_ok=True)
+                if rebinding and self.file.closed:
+                    self.file = self.fspath.open("r+b")
+
+                if ownPath and self.memoryMap and self.__view is None:
+                    self.__mapData()
+
+                raise
+
+            if os.name != "nt":
+                # The rename only survives a crash once the directory is synced
+                dirFd: int = os.open(target.parent, os.O_RDONLY)
+                try:
+                    os.fsync(dirFd)
+
+                finally:
+                    os.close(dirFd)
+
+            if rebinding:
+                self.file.close()
+                self.file = svpath.open("r+b")
+
+            if ownPath:
+                self.version = version
+                self.compression = compressing
+                self.compressionLevel = compressionLevel
+                self.blockSize = blockSize if blocking else 0
+                self.dictionary = dictData
+                self.__decompressor = self.__newDecompressor()
+                self.dirty = False
+
+            if rebinding:
+                self.__dataStart = headerLen
+                self.__dataLen = archiveLen - headerLen
+                self.__blocks = blocks
+                self.__cachedBlock = None
+                if compressing and not blocking:
+                    self.file.seek(headerLen)
+                    self.__spillData()
+
+                if self.memoryMap:
+                    self.__mapData()
+
+                rebindStruct()
+                for fileIO in list(self._openFiles):
+                    fileIO._rebindArchive()
+
+    def _copyData(self, data: bytes | bytearray | memoryview | ArchiveData | SpilledData, start: int, size: int, dst: BinaryIO) -> None:
+        self._check_closed()
+        src: BinaryIO | None = None
+        srcOffset: int = start
+        if isinstance(data, SpilledData):
+            src = data.file
+
+        elif isinstance(data, ArchiveData) and self.__view is None and not (self.compression and self.blockSize > 0):
+            src = self.file
+            srcOffset = self.__dataStart + data.offset + start
+
+        copied: int = 0
+        if src is not None:
+            try:
+                # The kernel copies what's on disk, so the file's own buffer is flushed first
+                src.flush()
+                srcFd: int | None = src.fileno()
+                dstFd: int = dst.fileno()
+                dst.flush()
+                dstPos: int = dst.tell()
+
+            except (OSError, AttributeError, UnsupportedOperation):
+                srcFd = None
+
+            if srcFd is not None:
+                for kernelCopy in ("copy_file_range", "sendfile"):
+                    if copied == size or not hasattr(os, kernelCopy):
+                        continue
+
+                    try:
+                        while copied < size:
+                            if kernelCopy == "copy_file_range":
+                                sent: int = os.copy_file_range(srcFd, dstFd, size - copied, srcOffset + copied, dstPos + copied)
+
+                            else:
+                                os.lseek(dstFd, dstPos + copied, os.SEEK_SET)
+                                sent = os.sendfile(dstFd, srcFd, srcOffset + copied, size - copied)
+
+                            if sent == 0:
+                                break
+
+                            copied += sent
+
+                    except OSError:
+                        pass
+
+                dst.seek(dstPos + copied)
+
+        if copied == size:
+            return
+
+        if src is not None:
+            buffer: memoryview = memoryview(bytearray(min(PortableFS.chunkSize, size - copied)))
+            while copied < size:
+                src.seek(srcOffset + copied)
+                read: int = src.readinto(buffer[:min(len(buffer), size - copied)]) # pyright: ignore[reportAttributeAccessIssue]
+                if read == 0:
+                    raise PortableFSEncodingError(f"File data runs past the end of the archive")
+
+                dst.write(buffer[:read])
+                copied += read
+
+            return
+
+        if not isinstance(data, ArchiveData):
+            with memoryview(data) as view:
+                dst.write(view[start:start + size])
+
+            return
+
+        step: int = max(self.blockSize, PortableFS.chunkSize) if self.compression and self.blockSize > 0 else size
+        while copied < size:
+            num: int = min(step, size - copied)
+            dst.write(self._loadData(data, start + copied, num))
+            copied += num
+
+    def __appendData(self, header: bytearray, dataOffsetPos: int, blockIndexPos: int, pieces: list[bytes | bytearray | memoryview | SpilledData], appendLen: int, blockSize: int, newCompressor: Callable[[], zstd.ZstdCompressor], threads: int, blocks: list[tuple[int, int]]) -> None:
+        print(f"Appending {appendLen} bytes of changed files")
+        header[dataOffsetPos:dataOffsetPos + 8] = self.__dataStart.to_bytes(8, byteorder="big")
+        self.file.seek(self.__dataStart + self.__dataLen)
+        progress: Iterator = tqdm(pieces, desc="Saving data", disable=appendLen <= PortableFS.chunkSize)
+        if blockSize > 0:
+            self.__writeBlocks(self.file, progress, blockSize, newCompressor, threads, blocks, self.__dataLen)
+            header[blockIndexPos + 4:blockIndexPos + 4 + self._BLOCK_ENTRY.size * len(blocks)] = b"".join([self._BLOCK_ENTRY.pack(frameOffset, frameLen) for frameOffset, frameLen in blocks])
 
-            with svpath.open("wb") as file:
-                file.write(data)
+        else:
+            for piece in progress:
+                self._copyData(piece, 0, piece.size if isinstance(piece, SpilledData) else len(piece), self.file)
+
+        # The old header keeps pointing at the old data until the appended data is on disk
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        dataEnd: int = self.file.seek(0, 2)
+        self.file.seek(0)
+        self.file.write(header)
+        self.file.write(bytes(self.__dataStart - len(header)))
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.__dataLen = dataEnd - self.__dataStart
+        self.__blocks = blocks
+        if self.memoryMap:
+            self.__unmapData()
+            self.__mapData()
+
+    def __iterData(self, data: bytes | bytearray | memoryview | ArchiveData | SpilledData) -> Iterator[bytes | bytearray | memoryview]:
+        if not isinstance(data, (ArchiveData, SpilledData)):
+            yield data
+            return
+
+        step: int = max(self.blockSize, PortableFS.chunkSize) if isinstance(data, ArchiveData) and self.compression and self.blockSize > 0 else PortableFS.chunkSize
+        for start in range(0, data.size, step):
+            yield self._loadData(data, start, min(step, data.size - start))
+
+    def __writeBlocks(self, out: BinaryIO, pieces: Iterator[bytes | bytearray | memoryview | ArchiveData | SpilledData], blockSize: int, newCompressor: Callable[[], zstd.ZstdCompressor], threads: int, blocks: list[tuple[int, int]], frameOffset: int) -> None:
+        workers: int = (os.cpu_count() or 1) if threads < 0 else threads
+        # Compressors aren't thread safe, so every worker keeps its own
+        compressors: threading.local = threading.local()
+
+        def compress(content: bytes | bytearray | memoryview) -> bytes:
+            if not hasattr(compressors, "compressor"):
+                compressors.compressor = newCompressor()
+
+            return compressors.compressor.compress(content)
+
+        def writeFrame(frame: bytes) -> None:
+            nonlocal frameOffset
+            out.write(frame)
+            blocks.append((frameOffset, len(frame)))
+            frameOffset += len(frame)
+
+        pool: ThreadPoolExecutor | None = ThreadPoolExecutor(workers) if workers > 1 else None
+        pending: deque[Future[bytes]] = deque()
+
+        def addBlock(content: bytes | bytearray | memoryview) -> None:
+            if pool is None:
+                writeFrame(compress(content))
+                return
+
+            pending.append(pool.submit(compress, content))
+            while len(pending) > workers * 2:
+                writeFrame(pending.popleft().result())
+
+        try:
+            block: bytearray = bytearray()
+            for piece in pieces:
+                for chunk in self.__iterData(piece):
+                    with memoryview(chunk) as view:
+                        pos: int = 0
+                        while pos < len(view):
+                            if len(block) == 0 and len(view) - pos >= blockSize:
+                                addBlock(view[pos:pos + blockSize])
+                                pos += blockSize
+                                continue
+
+                            num: int = min(blockSize - len(block), len(view) - pos)
+                            block.extend(view[pos:pos + num])
+                            pos += num
+                            if len(block) == blockSize:
+                                addBlock(block)
+                                block = bytearray()
+
+            if len(block) > 0:
+                addBlock(block)
+
+            while len(pending) > 0:
+                writeFrame(pending.popleft().result())
+
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
 
     @staticmethod
     def new(name: str, drives: list[str]):
@@ -36,25 +36,27 @@ def copyDirToPFS(pfs: PortableFS, realpath: Path, pfspath, excludedPaths: list[s
     if not pfspath.exists():
         pfspath.mkdir()
 
-    for path in realpath.iterdir():
-        if excludedPaths and path.name in excludedPaths:
-            continue
-
-        if path.is_file():
-            print(f"Copying File {path}")
-            pth = pfspath.joinpath(path.name)
-            copyFileToPFS(pfs, path, pth)
-
-        if path.is_dir():
-            print(f"Copying Dir from {realpath}")
-            pth = pfspath.joinpath(path.name)
-            if excludedPaths:
-                excludedSubPaths = [excl[len(path.name)+1:] for excl in excludedPaths if excl.startswith(path.name + "/")]
-
-            else:
-                excludedSubPaths = None
-
-            copyDirToPFS(pfs, path, pth, excludedSubPaths)
+    excluded: set[Path] = set([Path(excl) for excl in excludedPaths]) if excludedPaths else set()
+    for dirpath, dirnames, filenames in realpath.walk(follow_symlinks=True):
+        relpath: Path = dirpath.relative_to(realpath)
+        pfsdir = pfspath.joinpath(*relpath.parts)
+        # Excluded directories are pruned here so they are never walked into
+        dirnames[:] = [dirname for dirname in dirnames if relpath.joinpath(dirname) not in excluded]
+        for filename in filenames:
+            if relpath.joinpath(filename) in excluded:
+                continue
+
+            print(f"Copying File {dirpath.joinpath(filename)}")
+            copyFileToPFS(pfs, dirpath.joinpath(filename), pfsdir.joinpath(filename))
+
+        for dirname in dirnames:
+            print(f"Copying Dir from {dirpath}")
+            pth = pfsdir.joinpath(dirname)
+            if pth.is_file():
+                raise ValueError("Cannot copy a file, use 'copyFileToPFS' for copying files")
+
+            if not pth.exists():
+                pth.mkdir()
 
 def copyFileToRealFS(pfs: PortableFS, realpath: Path, pfspath) -> None:
     if not isinstance(pfspath, pfs.Path):
@@ -69,11 +71,8 @@ def copyFileToRealFS(pfs: PortableFS, realpath: Path, pfspath) -> None:
     if not realpath.exists():
         realpath.touch()
 
-    with pfspath.open("rb") as ogfile:
-        content: bytes = ogfile.read() # pyright: ignore[reportAssignmentType]
-
-    with realpath.open("wb") as dupfile:
-        dupfile.write(content)
+    with pfspath.open("rb") as ogfile, realpath.open("wb") as dupfile:
+        ogfile.copyto(dupfile)
 
 def copyDirToRealFS(pfs: PortableFS, realpath: Path, pfspath) -> None:
     if not isinstance(pfspath, pfs.Path):
@@ -88,11 +87,20 @@ def copyDirToRealFS(pfs: PortableFS, realpath: Path, pfspath) -> None:
     if not realpath.exists():
         realpath.mkdir()
 
-    for path in pfspath.iterdir():
-        if path.is_file():
-            pth: Path = realpath.joinpath(path.name)
-            copyFileToRealFS(pfs, pth, path)
+    toCopy: list = [(pfspath, realpath)]
+    while len(toCopy) > 0:
+        pfsdir, realdir = toCopy.pop()
+        for entry in pfsdir.scandir():
+            pth: Path = realdir.joinpath(entry.name)
+            if entry.is_file():
+                with entry.open("rb") as ogfile, pth.open("wb") as dupfile:
+                    ogfile.copyto(dupfile)
+
+            if entry.is_dir():
+                if pth.is_file():
+                    raise ValueError("Cannot copy a directory to replace a file")
+
+                if not pth.exists():
+                    pth.mkdir()
 
-        if path.is_dir():
-            pth: Path = realpath.joinpath(path.name)
-            copyDirToRealFS(pfs, pth, path)
\ No newline at end of file
+                toCopy.append((entry.path, pth))
\ No newline at end of file
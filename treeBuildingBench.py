@@ -0,0 +1,61 @@
+from pfs import *
+from io import BytesIO
+import gc
+import math
+import random
+import tester
+import time
+
+def buildArchive(numDirs: int, filesPerDir: int, *, chain: bool = False) -> bytes:
+    # Every directory comes before its parent in the table, which is the worst order for placing them
+    rand: random.Random = random.Random(0)
+    parents: list[int] = [0 if i == 0 else i + 15 if chain else rand.randint(max(15, i - 985), i + 15) for i in range(numDirs)]
+    data: bytearray = bytearray(b"pfs0" + bytes([0]) + b"treeBench".ljust(13, b"\x00") + bytes([1, 0]))
+    data.extend(numDirs.to_bytes(2, byteorder="big"))
+    for i in reversed(range(numDirs)):
+        name: bytes = f"dir{i}".encode()
+        data.extend((i + 16).to_bytes(2, byteorder="big") + bytes([len(name)]) + name + bytes([0]) + (parents[i] if parents[i] > 15 else 0).to_bytes(2, byteorder="big"))
+
+    data.extend((numDirs * filesPerDir).to_bytes(3, byteorder="big"))
+    for i in reversed(range(numDirs * filesPerDir)):
+        name = f"file{i}.bin".encode()
+        data.extend(bytes([len(name)]) + name + bytes([0]) + (i // filesPerDir + 16).to_bytes(2, byteorder="big") + bytes(16))
+
+    return bytes(data)
+
+def loadTime(data: bytes) -> float:
+    best: float = float("inf")
+    gc.collect()
+    for _ in range(3):
+        start: float = time.perf_counter()
+        PortableFS(BytesIO(data)).close()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+def scaling(sizes: list[int], filesPerDir: int, *, chain: bool = False) -> float:
+    times: list[float] = []
+    print(f"{'dirs':>6} {'files':>7} {'load (s)':>9} {'us/entry':>9}")
+    for numDirs in sizes:
+        times.append(loadTime(buildArchive(numDirs, filesPerDir, chain=chain)))
+        print(f"{numDirs:>6} {numDirs * filesPerDir:>7} {times[-1]:>9.3f} {times[-1] / (numDirs * (filesPerDir + 1)) * 1e6:>9.2f}")
+
+    # The slope of log time against log size is the exponent of the growth, 1 for linear and 2 for quadratic
+    xs: list[float] = [math.log(size) for size in sizes]
+    ys: list[float] = [math.log(taken) for taken in times]
+    meanX, meanY = sum(xs) / len(xs), sum(ys) / len(ys)
+    slope: float = sum([(x - meanX) * (y - meanY) for x, y in zip(xs, ys)]) / sum([(x - meanX) ** 2 for x in xs])
+    print(f"growth exponent: {slope:.2f}")
+    return slope
+
+if __name__ == "__main__":
+    tester.GLOBALS |= {"scaling": scaling}
+
+    tester.describe("PortableFS Tree Building", r'''
+    it("wide trees load in linear time", """
+        passed(scaling([2000, 4000, 8000, 16000, 32000], 4) < 1.3)
+    """)
+    it("deep chains load in linear time", """
+        passed(scaling([2000, 4000, 8000, 16000, 32000], 4, chain=True) < 1.3)
+    """)
+    ''')
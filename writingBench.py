@@ -0,0 +1,62 @@
+from pfs import *
+from io import BytesIO
+import tester
+import time
+
+def newFS() -> PortableFS:
+    return PortableFS(BytesIO(b"pfs0" + bytes([1, 0]) + b"writeBench".ljust(13, b"\x00") + bytes([1, 0]) + bytes(5)))
+
+def writeTime(size: int, chunkSize: int, mode: str = "wb", flush: bool = False) -> float:
+    pfs: PortableFS = newFS()
+    pth = pfs.Path("A:/big.bin")
+    pth.touch()
+    chunk: bytes = bytes(range(256)) * (chunkSize // 256)
+    start: float = time.perf_counter()
+    with pth.open(mode) as file:
+        for _ in range(size // chunkSize):
+            file.write(chunk)
+            if flush:
+                file.flush()
+
+    taken: float = time.perf_counter() - start
+    with pth.open("rb") as file:
+        assert len(file.read()) == size
+
+    pfs.close()
+    return taken
+
+def scaling(sizes: list[int], chunkSize: int, mode: str = "wb", flush: bool = False) -> list[float]:
+    perMiB: list[float] = []
+    print(f"{'MiB':>5} {'write (s)':>10} {'MiB/s':>8}")
+    for size in sizes:
+        taken: float = writeTime(size, chunkSize, mode, flush)
+        perMiB.append(taken / (size / 0x100000))
+        print(f"{size // 0x100000:>5} {taken:>10.3f} {size / 0x100000 / taken:>8.0f}")
+
+    return perMiB
+
+if __name__ == "__main__":
+    tester.GLOBALS |= {"PortableFS": PortableFS, "scaling": scaling}
+
+    # Chunks are added onto the end of the file's buffer, so the time per MiB stays flat as the file grows
+    tester.describe("PortableFS Chunked Writing", r'''
+    it("writing in 64 KiB chunks is linear", """
+        perMiB = scaling([0x2000000, 0x4000000, 0x8000000], 0x10000)
+        passed(perMiB[-1] < perMiB[0] * 2)
+    """)
+    it("appending in 64 KiB chunks is linear", """
+        perMiB = scaling([0x2000000, 0x4000000, 0x8000000], 0x10000, "ab")
+        passed(perMiB[-1] < perMiB[0] * 2)
+    """)
+    it("flushing after every chunk is linear", """
+        perMiB = scaling([0x2000000, 0x4000000, 0x8000000], 0x10000, flush=True)
+        passed(perMiB[-1] < perMiB[0] * 2)
+    """)
+    it("writing past the file memory budget is linear", """
+        budget = PortableFS.fileMemoryBudget
+        PortableFS.fileMemoryBudget = 0x1000000
+        perMiB = scaling([0x2000000, 0x4000000, 0x8000000], 0x10000)
+        PortableFS.fileMemoryBudget = budget
+        passed(perMiB[-1] < perMiB[0] * 2)
+    """)
+    ''')